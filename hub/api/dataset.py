@@ -264,6 +264,8 @@ class dataset:
         dest_creds: dict,
         compression: str,
         overwrite: bool = False,
+        compression_quality: Optional[int] = None,
+        max_side: Optional[int] = None,
         **dataset_kwargs,
     ) -> Dataset:
         """Ingests a dataset from a source and stores it as a structured dataset to destination
@@ -317,6 +319,10 @@ class dataset:
             dest_creds (dict): A dictionary containing credentials used to access the destination path of the dataset.
             compression (str): Compression type of dataset.
             overwrite (bool): WARNING: If set to True this overwrites the dataset if it already exists. This can NOT be undone! Defaults to False.
+            compression_quality (int, optional): Quality (1-100) used when images are compressed into a lossy `compression` like jpeg.
+                Setting it re-encodes images even if they are already stored in `compression`. Defaults to None (the encoder's default).
+            max_side (int, optional): Images are downscaled (preserving their aspect ratio) so that their height and width don't exceed this.
+                Defaults to None (images are stored in their original resolution).
             **dataset_kwargs: Any arguments passed here will be forwarded to the dataset creator function.
 
         Returns:
@@ -339,9 +345,12 @@ class dataset:
         unstructured = ImageClassification(source=src)
 
         # TODO: auto detect compression
-        unstructured.structure(
-            ds, image_tensor_args={"sample_compression": compression}  # type: ignore
-        )
+        image_tensor_args = {
+            "sample_compression": compression,
+            "compression_quality": compression_quality,
+            "max_side": max_side,
+        }
+        unstructured.structure(ds, image_tensor_args=image_tensor_args)  # type: ignore
 
         return ds  # type: ignore
 
@@ -354,6 +363,8 @@ class dataset:
         dest_creds: dict,
         compression: str,
         overwrite: bool = False,
+        compression_quality: Optional[int] = None,
+        max_side: Optional[int] = None,
         **dataset_kwargs,
     ) -> Dataset:
         """Download and ingest a kaggle dataset and store it as a structured dataset to destination
@@ -372,6 +383,10 @@ class dataset:
             dest_creds (dict): A dictionary containing credentials used to access the destination path of the dataset.
             compression (str): Compression type of dataset.
             overwrite (bool): WARNING: If set to True this overwrites the dataset if it already exists. This can NOT be undone! Defaults to False.
+            compression_quality (int, optional): Quality (1-100) used when images are compressed into a lossy `compression` like jpeg.
+                Setting it re-encodes images even if they are already stored in `compression`. Defaults to None (the encoder's default).
+            max_side (int, optional): Images are downscaled (preserving their aspect ratio) so that their height and width don't exceed this.
+                Defaults to None (images are stored in their original resolution).
             **dataset_kwargs: Any arguments passed here will be forwarded to the dataset creator function.
 
         Returns:
@@ -392,6 +407,8 @@ class dataset:
             dest_creds=dest_creds,
             compression=compression,
             overwrite=overwrite,
+            compression_quality=compression_quality,
+            max_side=max_side,
             **dataset_kwargs,
         )
 
@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 import hub
 from hub.core.dataset import Dataset
+from hub.core.storage import LocalProvider
 from hub.tests.common import assert_array_lists_equal
 from hub.util.exceptions import (
     TensorDtypeMismatchError,
@@ -86,6 +87,65 @@ def test_persist_clear_cache(ds_generator):
     np.testing.assert_array_equal(ds_new.image.numpy(), np.ones((4, 224, 224, 3)))
 
 
+@enabled_persistent_dataset_generators
+def test_partial_chunk_read(ds_generator):
+    ds = ds_generator()
+    ds.create_tensor("image", sample_compression="png")
+    ds.create_tensor("dynamic")
+
+    images = np.random.randint(0, 255, (4, 32, 32, 3), dtype="uint8")
+    ds.image.extend(images)
+    for i in range(4):
+        ds.dynamic.append(np.arange(i, dtype="int32"))
+    ds.clear_cache()
+
+    ds_new = ds_generator()
+    np.testing.assert_array_equal(ds_new.image[2].numpy(), images[2])
+    np.testing.assert_array_equal(ds_new.dynamic[3].numpy(), np.arange(3))
+
+    # the chunks were read partially, so they were not cached
+    cache = ds_new.image.chunk_engine.cache
+    assert not any("chunks/" in key for key in cache.lru_sizes)
+
+    # chunks that were already read partially are read as a whole and cached
+    np.testing.assert_array_equal(ds_new.image[1:3].numpy(), images[1:3])
+    np.testing.assert_array_equal(ds_new.dynamic[0].numpy(), np.arange(0))
+    assert sum("chunks/" in key for key in cache.lru_sizes) == 2
+
+    np.testing.assert_array_equal(ds_new.image.numpy(), images)
+
+
+def test_sequential_chunk_reads(local_ds_generator, monkeypatch):
+    ds = local_ds_generator()
+    ds.create_tensor("x")
+    ds.x.extend(np.arange(100, dtype="int32").reshape(100, 1))
+    ds.clear_cache()
+
+    chunk_reads = []
+    getitem = LocalProvider.__getitem__
+    get_bytes = LocalProvider.get_bytes
+
+    def _getitem(self, path):
+        if "chunks/" in path:
+            chunk_reads.append(path)
+        return getitem(self, path)
+
+    def _get_bytes(self, path, *args, **kwargs):
+        if "chunks/" in path:
+            chunk_reads.append(path)
+        return get_bytes(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(LocalProvider, "__getitem__", _getitem)
+    monkeypatch.setattr(LocalProvider, "get_bytes", _get_bytes)
+
+    ds_new = local_ds_generator()
+    for i in range(100):
+        np.testing.assert_array_equal(ds_new.x[i].numpy(), [i])
+
+    # the first read is partial (header and sample), the second one reads and caches the whole chunk
+    assert len(chunk_reads) == 3
+
+
 @enabled_datasets
 def test_populate_dataset(ds):
     assert ds.meta.tensors == []
@@ -251,6 +311,14 @@ def test_scalar_samples(ds: Dataset):
 
     assert tensor.shape == (16,)
 
+    # indexing a single scalar sample returns a 0-d array
+    sample = tensor[2].numpy()
+    assert isinstance(sample, np.ndarray)
+    assert sample.shape == ()
+    assert sample == -99
+    sample[()] = 0
+    np.testing.assert_array_equal(tensor[1:3].numpy(), [10, -99])
+
     # len(shape) for a scalar is `()`. len(shape) for [1] is `(1,)`
     with pytest.raises(TensorInvalidSampleShapeError):
         tensor.append([1])
@@ -440,10 +508,17 @@ def test_dtype(memory_ds: Dataset):
     # test auto upcasting
     np_dtyped_tensor.append(np.ones((10, 10), dtype="float32"))
     py_dtyped_tensor.append(np.ones((10, 10), dtype="float32"))
+    np_dtyped_tensor.extend(np.ones((2, 10, 10), dtype="float32"))
+    py_dtyped_tensor.extend([np.ones((10, 10), dtype="float32")] * 2)
+    np.testing.assert_array_equal(np_dtyped_tensor.numpy(), np.ones((4, 10, 10)))
+    np.testing.assert_array_equal(py_dtyped_tensor.numpy(), np.ones((4, 10, 10)))
 
     with pytest.raises(TensorDtypeMismatchError):
         tensor.append(np.ones((10, 10), dtype="float64"))
 
+    with pytest.raises(TensorDtypeMismatchError):
+        tensor.extend(np.ones((2, 10, 10), dtype="float64"))
+
     with pytest.raises(TensorDtypeMismatchError):
         dtyped_tensor.append(np.ones((10, 10), dtype="uint64") * 256)
 
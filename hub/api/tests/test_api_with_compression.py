@@ -1,9 +1,11 @@
 from hub.util.exceptions import (
     SampleCompressionError,
+    TensorMetaInvalidHtypeOverwriteValue,
     TensorMetaMissingRequiredValue,
     UnsupportedCompressionError,
 )
 import pytest
+from hub.core.chunk_engine import ChunkEngine
 from hub.core.tensor import Tensor
 from hub.tests.common import TENSOR_KEY
 from hub.tests.dataset_fixtures import enabled_datasets
@@ -93,6 +95,58 @@ def test_uncompressed(ds: Dataset):
     np.testing.assert_array_equal(images[1:4].numpy(), np.ones((3, 101, 2, 1)))
 
 
+def test_no_extra_copy_on_uncompressed_extend(memory_ds: Dataset, monkeypatch):
+    tensor = memory_ds.create_tensor(TENSOR_KEY, dtype="float32")
+
+    buffers = []
+    append_uniform_bytes = ChunkEngine._append_uniform_bytes
+
+    def _append_uniform_bytes(self, buffer, *args):
+        buffers.append(buffer)
+        return append_uniform_bytes(self, buffer, *args)
+
+    monkeypatch.setattr(ChunkEngine, "_append_uniform_bytes", _append_uniform_bytes)
+
+    # arrays that already have the tensor's dtype are handed to the chunks without being copied
+    samples = np.ones((4, 10), dtype="float32")
+    tensor.extend(samples)
+    assert np.shares_memory(np.frombuffer(buffers[-1], dtype="uint8"), samples)
+
+    # other arrays are cast once, straight to the tensor's dtype
+    samples = np.ones((4, 10), dtype="float16")
+    tensor.extend(samples)
+    assert len(buffers[-1]) == samples.size * np.dtype("float32").itemsize
+    assert not np.shares_memory(np.frombuffer(buffers[-1], dtype="uint8"), samples)
+
+    np.testing.assert_array_equal(tensor.numpy(), np.ones((8, 10)))
+
+
+def test_compressed_upcast(memory_ds: Dataset):
+    images = memory_ds.create_tensor(
+        TENSOR_KEY, htype="image", sample_compression="png"
+    )
+    masks = np.arange(3 * 8 * 8).reshape(3, 8, 8) % 2 == 0
+
+    # samples are cast to the tensor's dtype before they are compressed
+    images.extend(masks)
+    images.extend(list(masks))
+
+    assert images.dtype == np.uint8
+    np.testing.assert_array_equal(images.numpy(), np.concatenate([masks, masks]))
+
+
+def test_compressed_samples_are_writable(memory_ds: Dataset):
+    images = memory_ds.create_tensor(
+        TENSOR_KEY, htype="image", sample_compression="png"
+    )
+    images.extend(np.zeros((2, 8, 8, 3), dtype="uint8"))
+
+    # samples can be modified in place
+    for sample in images.numpy(aslist=True):
+        sample[0, 0] = 1
+    images[0].numpy()[0, 0] = 1
+
+
 @pytest.mark.xfail(raises=SampleCompressionError, strict=True)
 @pytest.mark.parametrize(
     "bad_shape",
@@ -137,3 +191,59 @@ def test_unsupported_compression(memory_ds: Dataset):
 @pytest.mark.xfail(raises=TensorMetaMissingRequiredValue, strict=True)
 def test_missing_sample_compression_for_image(memory_ds: Dataset):
     memory_ds.create_tensor("tensor", htype="image")
+
+
+@enabled_datasets
+def test_spatial_indexing(ds: Dataset, cat_path):
+    images = ds.create_tensor(TENSOR_KEY, htype="image", sample_compression="jpeg")
+    images.extend([hub.read(cat_path), hub.read(cat_path)])
+    ds.clear_cache()
+    expected = images.numpy()
+
+    np.testing.assert_array_equal(
+        images[0, 100:200, 50:300].numpy(), expected[0, 100:200, 50:300]
+    )
+    np.testing.assert_array_equal(images[:, 3:, -20:].numpy(), expected[:, 3:, -20:])
+    np.testing.assert_array_equal(images[1, 5:17].numpy(), expected[1, 5:17])
+    np.testing.assert_array_equal(images[0, 10:20, 3].numpy(), expected[0, 10:20, 3])
+    assert images[:, 5:5].numpy().shape == (2, 0, 900, 3)
+
+
+def test_quality_and_max_side(memory_ds: Dataset, cat_path):
+    images = memory_ds.create_tensor(
+        "images",
+        htype="image",
+        sample_compression="jpeg",
+        compression_quality=50,
+        max_side=64,
+    )
+    images.append(hub.read(cat_path))
+    images.extend(np.ones((2, 128, 32, 3), dtype="uint8"))
+    images.append(np.ones((10, 10, 3), dtype="uint8"))
+
+    shapes = [sample.shape for sample in images.numpy(aslist=True)]
+    assert max(shapes[0][:2]) == 64
+    assert shapes[1:] == [(64, 16, 3), (64, 16, 3), (10, 10, 3)]
+
+
+def test_max_side_uncompressed(memory_ds: Dataset):
+    images = memory_ds.create_tensor(
+        "images", htype="image", sample_compression=None, max_side=8
+    )
+
+    # only compressed images are downscaled, arrays with any number of channels can be stored uncompressed
+    images.extend(np.ones((2, 16, 16, 5), dtype="uint8"))
+    images.append(np.ones((16, 16, 5), dtype="uint8"))
+
+    assert images.numpy().shape == (3, 16, 16, 5)
+
+
+@pytest.mark.parametrize(
+    "overwrite",
+    [{"compression_quality": 0}, {"compression_quality": 101}, {"max_side": -1}],
+)
+def test_invalid_quality_and_max_side(memory_ds: Dataset, overwrite):
+    with pytest.raises(TensorMetaInvalidHtypeOverwriteValue):
+        memory_ds.create_tensor(
+            "images", htype="image", sample_compression="jpeg", **overwrite
+        )
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from hub.constants import KB
 
 
@@ -119,3 +120,60 @@ def test_extend_and_append(memory_ds):
     _assert_num_chunks(images, 20)
 
     assert len(ds) == 400
+
+
+def test_read_across_chunks(memory_ds):
+    ds = memory_ds
+    images, labels = _create_tensors(ds)
+
+    _update_chunk_sizes(ds, 32 * KB)
+
+    _append_tensors(images, labels)
+    _assert_num_chunks(images, 5)
+
+    expected = np.ones((100, 28, 28), dtype=np.uint8) * np.arange(100).reshape(
+        100, 1, 1
+    )
+
+    np.testing.assert_array_equal(images.numpy(), expected)
+    np.testing.assert_array_equal(images[10:90:7].numpy(), expected[10:90:7])
+    np.testing.assert_array_equal(images[95:5:-3].numpy(), expected[95:5:-3])
+    np.testing.assert_array_equal(
+        images[15:65, 3, 2:5].numpy(), expected[15:65, 3, 2:5]
+    )
+    np.testing.assert_array_equal(labels[20:40].numpy(), np.arange(20, 40))
+
+
+def test_extend_sequence(memory_ds):
+    ds = memory_ds
+    images, labels = _create_tensors(ds)
+
+    _update_chunk_sizes(ds, 32 * KB)
+
+    # a list of arrays is appended without being stacked into a single array first
+    samples = [np.ones((28, 28), dtype=np.uint8) * i for i in range(100)]
+    images.extend(samples)
+
+    _assert_num_chunks(images, 5)
+    np.testing.assert_array_equal(images.numpy(), np.stack(samples))
+
+
+def test_extend_dynamic_sequence_too_large(memory_ds):
+    ds = memory_ds
+    images, labels = _create_tensors(ds)
+
+    _update_chunk_sizes(ds, 32 * KB)
+
+    # samples with different shapes, the last one is larger than the min chunk size
+    samples = [np.ones((i, i), dtype=np.uint8) for i in range(1, 10)]
+    samples.append(np.ones((200, 200), dtype=np.uint8))
+
+    with pytest.raises(NotImplementedError):
+        images.extend(samples)
+
+    # all samples are validated before any of them are added
+    assert len(images) == 0
+
+    images.extend(samples[:-1])
+    assert len(images) == 9
+    np.testing.assert_array_equal(images[4].numpy(), samples[4])
@@ -36,6 +36,25 @@ def test_ingestion_simple(memory_ds: Dataset):
     assert ds.labels.info.class_names == ("class0", "class1", "class2")
 
 
+def test_ingestion_downscaled(memory_ds: Dataset):
+    path = get_dummy_data_path("tests_auto/image_classification")
+
+    ds = hub.ingest(
+        src=path,
+        dest=memory_ds.path,
+        dest_creds=None,
+        compression="jpeg",
+        overwrite=False,
+        compression_quality=95,
+        max_side=100,
+    )
+
+    assert ds.images.meta.compression_quality == 95
+    assert ds.images.meta.max_side == 100
+    assert ds.images.numpy().shape == (3, 100, 100, 3)
+    assert ds.labels.numpy().shape == (3,)
+
+
 def test_image_classification_sets(memory_ds: Dataset):
     path = get_dummy_data_path("tests_auto/image_classification_with_sets")
     ds = hub.ingest(
@@ -87,7 +87,7 @@ class ImageClassification(UnstructuredDataset):
         Args:
             ds (Dataset) : A Hub dataset object.
             use_progress_bar (bool): Defines if the method uses a progress bar. Defaults to True.
-            image_tensor_args (dict): Defines the sample compression of the dataset (jpeg or png).
+            image_tensor_args (dict): Arguments for creating the image tensors, like the sample compression of the dataset (jpeg or png).
 
         Returns:
             A hub dataset.
@@ -13,6 +13,9 @@ DEFAULT_HTYPE = "generic"
 SUPPORTED_COMPRESSIONS = ["png", "jpg", "jpeg", None]
 COMPRESSION_ALIASES = {"jpg": "jpeg"}
 
+# same as PIL's default, so jpeg samples are encoded the same way regardless of the library used
+DEFAULT_JPEG_QUALITY = 75
+
 # used for requiring the user to specify a value for htype properties. notates that the htype property has no default.
 REQUIRE_USER_SPECIFICATION = "require_user_specification"
 
@@ -28,6 +31,13 @@ SUPPORTED_MODES = ["r", "a"]
 # min chunk size is always half of `DEFAULT_MAX_CHUNK_SIZE`
 DEFAULT_MAX_CHUNK_SIZE = 32 * MB
 
+# number of bytes requested when reading a chunk's header without its data. larger headers need another request
+CHUNK_HEADER_PREFETCH_SIZE = 4 * KB
+
+# chunks that are not cached are not read entirely if at most this many of their samples are needed. the header and
+# each sample are read with ranged requests instead
+MAX_SAMPLES_FOR_PARTIAL_CHUNK_READ = 4
+
 MIN_FIRST_CACHE_SIZE = 32 * MB
 MIN_SECOND_CACHE_SIZE = 160 * MB
 
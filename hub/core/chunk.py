@@ -1,14 +1,22 @@
 from hub.util.exceptions import FullChunkError
 import hub
 from hub.core.storage.cachable import Cachable
-from typing import Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 import numpy as np
 from io import BytesIO
 
+from hub.constants import CHUNK_HEADER_PREFETCH_SIZE
+
 from hub.core.meta.encode.shape import ShapeEncoder
 from hub.core.meta.encode.byte_positions import BytePositionsEncoder
 
-from hub.core.serialize import serialize_chunk, deserialize_chunk, infer_chunk_num_bytes
+from hub.core.serialize import (
+    serialize_chunk,
+    deserialize_chunk,
+    deserialize_chunk_header,
+    infer_chunk_header_num_bytes,
+    infer_chunk_num_bytes,
+)
 
 
 class Chunk(Cachable):
@@ -26,12 +34,14 @@ class Chunk(Cachable):
 
             Header:
                 All samples this chunk contains need 2 components: shape and byte position.
-                `ShapeEncoder` handles encoding the `start_byte` and `end_byte` for each sample.
-                `BytePositionsEncoder` handles encoding the `shape` for each sample.
+                `ShapeEncoder` handles encoding the `shape` for each sample.
+                `BytePositionsEncoder` handles encoding the `start_byte` and `end_byte` for each sample.
 
             Data:
                 All samples this chunk contains are added into `_data` in bytes form directly adjacent to one another, without
                 delimeters.
+                `_data` may be larger than the bytes it holds (capacity is grown geometrically), only the first
+                `num_data_bytes` bytes are valid. The unused capacity is dropped by `shrink_to_fit`.
 
             See `tobytes` and `frombytes` for more on how chunks are serialized
 
@@ -47,16 +57,17 @@ class Chunk(Cachable):
         self.byte_positions_encoder = BytePositionsEncoder(encoded_byte_positions)
 
         self._data: Union[memoryview, bytearray] = data or bytearray()
+        self._num_data_bytes = len(self._data)
 
     @property
     def memoryview_data(self):
         if isinstance(self._data, memoryview):
             return self._data
-        return memoryview(self._data)
+        return memoryview(self._data)[: self._num_data_bytes]
 
     @property
     def num_data_bytes(self):
-        return len(self._data)
+        return self._num_data_bytes
 
     def is_under_min_space(self, min_data_bytes_target: int) -> bool:
         """If this chunk's data is less than `min_data_bytes_target`, returns True."""
@@ -78,6 +89,28 @@ class Chunk(Cachable):
             FullChunkError: If `buffer` is too large.
         """
 
+        self.append_samples(buffer, max_data_bytes, shape, 1)
+
+    def append_samples(
+        self,
+        buffer: memoryview,
+        max_data_bytes: int,
+        shape: Tuple[int],
+        num_samples: int,
+    ):
+        """Store `buffer` in this chunk as `num_samples` samples that all have the same shape and number of bytes.
+        The headers are updated once for the whole batch.
+
+        Args:
+            buffer (memoryview): Buffer that represents `num_samples` samples directly adjacent to one another.
+            max_data_bytes (int): Used to determine if this chunk has space for `buffer`.
+            shape (Tuple[int]): Shape for every sample that `buffer` represents.
+            num_samples (int): Number of samples that `buffer` represents.
+
+        Raises:
+            FullChunkError: If `buffer` is too large.
+        """
+
         incoming_num_bytes = len(buffer)
 
         if not self.has_space_for(incoming_num_bytes, max_data_bytes):
@@ -85,37 +118,150 @@ class Chunk(Cachable):
                 f"Chunk does not have space for the incoming bytes (incoming={incoming_num_bytes}, max={max_data_bytes})."
             )
 
-        # `_data` will be a `memoryview` if `frombuffer` is called.
-        if isinstance(self._data, memoryview):
-            self._data = bytearray(self._data)
+        # headers are updated first, they validate that `buffer` can be split into `num_samples` samples
+        self.update_headers(incoming_num_bytes, shape, num_samples)
 
         # note: incoming_num_bytes can be 0 (empty sample)
-        self._data += buffer
-        self.update_headers(incoming_num_bytes, shape)
+        start = self._num_data_bytes
+        end = start + incoming_num_bytes
+        self._reserve(end, max_data_bytes)
+        self._data[start:end] = buffer
+        self._num_data_bytes = end
+
+    def append_samples_multiple(
+        self, buffers: Sequence[memoryview], max_data_bytes: int, shape: Tuple[int]
+    ):
+        """Store each of `buffers` in this chunk as a single sample. All samples have the same shape, but not necessarily the
+        same number of bytes (compressed samples). The headers are updated once for the whole batch.
+
+        Args:
+            buffers (Sequence[memoryview]): Buffers that each represent a single sample.
+            max_data_bytes (int): Used to determine if this chunk has space for `buffers`.
+            shape (Tuple[int]): Shape for every sample that `buffers` represent.
+
+        Raises:
+            FullChunkError: If `buffers` are too large.
+        """
+
+        num_samples = len(buffers)
+        if num_samples == 0:
+            return
+
+        sizes = np.fromiter(map(len, buffers), dtype=np.int64, count=num_samples)
+        incoming_num_bytes = int(sizes.sum())
+
+        if not self.has_space_for(incoming_num_bytes, max_data_bytes):
+            raise FullChunkError(
+                f"Chunk does not have space for the incoming bytes (incoming={incoming_num_bytes}, max={max_data_bytes})."
+            )
+
+        self.shapes_encoder.register_samples(shape, num_samples)
+        self.byte_positions_encoder.register_samples_bulk(
+            sizes, np.ones(num_samples, dtype=np.int64)
+        )
+
+        start = self._num_data_bytes
+        self._reserve(start + incoming_num_bytes, max_data_bytes)
+        for buffer, size in zip(buffers, sizes.tolist()):
+            self._data[start : start + size] = buffer
+            start += size
+        self._num_data_bytes = start
+
+    def uniform_array(self, dtype) -> Optional[np.ndarray]:
+        """If every sample in this chunk has the same shape and number of bytes (always true for fixed-shape
+        uncompressed tensors), returns all of them as a single `(num_samples, *shape)` array. Otherwise returns None.
+
+        Note:
+            The array is a zero-copy view over `_data`, reading a sample from it is a slice instead of a `np.frombuffer`.
+
+        Args:
+            dtype (np.dtype): Data type of the samples in this chunk.
+
+        Returns:
+            Optional[np.ndarray]: All samples in this chunk, or None if the samples are not uniform.
+        """
+
+        shapes = self.shapes_encoder.array
+        byte_positions = self.byte_positions_encoder.array
+        if len(shapes) != 1 or len(byte_positions) != 1:
+            return None
+
+        num_samples = self.shapes_encoder.num_samples
+        shape = tuple(int(dim) for dim in self.shapes_encoder[0])
+        array = np.frombuffer(self.memoryview_data, dtype=dtype)
+        return array.reshape((num_samples, *shape))
+
+    def _reserve(self, num_bytes: int, max_data_bytes: int):
+        """Makes sure `_data` is a bytearray that can hold at least `num_bytes` bytes.
 
-    def update_headers(self, incoming_num_bytes: int, sample_shape: Tuple[int]):
+        Note:
+            Capacity is doubled (up to `max_data_bytes`) when it runs out, so appending samples one by one only
+                reallocates `_data` a logarithmic number of times.
+            Growing always allocates a new bytearray instead of resizing, so arrays/memoryviews that were previously
+                returned by `memoryview_data` stay valid.
+
+        Args:
+            num_bytes (int): Number of bytes `_data` needs to be able to hold.
+            max_data_bytes (int): The capacity is never grown beyond this, unless `num_bytes` is larger.
+        """
+
+        capacity = len(self._data)
+        if isinstance(self._data, bytearray) and num_bytes <= capacity:
+            return
+
+        new_capacity = max(num_bytes, min(2 * capacity, max_data_bytes))
+        data = bytearray(new_capacity)
+        data[: self._num_data_bytes] = self._data[: self._num_data_bytes]
+        self._data = data
+
+    def shrink_to_fit(self):
+        """Drops the unused capacity of `_data`. Should be called once no more samples will be appended to this chunk.
+
+        Note:
+            `_data` is copied instead of truncated in place, so arrays/memoryviews that were previously returned by
+                `memoryview_data` stay valid.
+        """
+
+        if isinstance(self._data, bytearray) and len(self._data) > self._num_data_bytes:
+            self._data = bytearray(self.memoryview_data)
+
+    def update_headers(
+        self, incoming_num_bytes: int, sample_shape: Tuple[int], num_samples: int = 1
+    ):
         """Updates this chunk's header. A chunk should NOT exist without headers.
 
         Args:
             incoming_num_bytes (int): The length of the buffer that was used to
             sample_shape (Tuple[int]): Every sample that `num_samples` symbolizes is considered to have `sample_shape`.
+            num_samples (int): Number of samples the buffer represents. Defaults to 1.
 
         Raises:
             ValueError: If `incoming_num_bytes` is not divisible by `num_samples`.
         """
 
-        num_bytes_per_sample = incoming_num_bytes
-        self.shapes_encoder.register_samples(sample_shape, 1)
-        self.byte_positions_encoder.register_samples(num_bytes_per_sample, 1)
+        if incoming_num_bytes % num_samples != 0:
+            raise ValueError(
+                f"Incoming bytes should be divisible by the number of samples. Got {incoming_num_bytes} bytes for {num_samples} samples."
+            )
+
+        num_bytes_per_sample = incoming_num_bytes // num_samples
+        self.shapes_encoder.register_samples(sample_shape, num_samples)
+        self.byte_positions_encoder.register_samples(num_bytes_per_sample, num_samples)
 
     @property
     def nbytes(self):
-        """Calculates the number of bytes `tobytes` will be without having to call `tobytes`. Used by `LRUCache` to determine if this chunk can be cached."""
+        """Calculates the number of bytes this chunk takes up in memory without having to call `tobytes`. Used by `LRUCache`
+        to determine if this chunk can be cached.
+
+        Note:
+            The unused capacity of `_data` is counted, so this can be larger than the length of `tobytes` until
+                `shrink_to_fit` is called.
+        """
 
         return infer_chunk_num_bytes(
             hub.__version__,
-            self.shapes_encoder.array,
-            self.byte_positions_encoder.array,
+            self.shapes_encoder,
+            self.byte_positions_encoder,
             len_data=len(self._data),
         )
 
@@ -124,12 +270,87 @@ class Chunk(Cachable):
             hub.__version__,
             self.shapes_encoder.array,
             self.byte_positions_encoder.array,
-            [self._data],
+            [self.memoryview_data],
         )
 
+    def get_bytes(
+        self, start_byte: Optional[int] = None, end_byte: Optional[int] = None
+    ) -> memoryview:
+        """Returns `self.tobytes()[start_byte:end_byte]`, without serializing more of the data than the range covers.
+        A range that lies entirely in the data is a zero-copy view over `_data`."""
+
+        start_byte = start_byte or 0
+        header_num_bytes = infer_chunk_num_bytes(
+            hub.__version__,
+            self.shapes_encoder,
+            self.byte_positions_encoder,
+            len_data=0,
+        )
+        data = self.memoryview_data
+
+        if start_byte >= header_num_bytes:
+            start = start_byte - header_num_bytes
+            end = None if end_byte is None else end_byte - header_num_bytes
+            return data[start:end]
+
+        # the range starts in the header, so only the header and the part of the data the range covers are serialized
+        if end_byte is not None:
+            data = data[: max(end_byte - header_num_bytes, 0)]
+        buffer = serialize_chunk(
+            hub.__version__,
+            self.shapes_encoder.array,
+            self.byte_positions_encoder.array,
+            [data],
+        )
+        return buffer[start_byte:end_byte]
+
     @classmethod
     def frombuffer(cls, buffer: bytes):
         if not buffer:
             return cls()
         version, shapes, byte_positions, data = deserialize_chunk(buffer)
         return cls(shapes, byte_positions, data=data)
+
+    @classmethod
+    def read_samples_bytes(
+        cls, storage, key: str, local_sample_indices: Sequence[int]
+    ) -> List[Tuple[bytes, Tuple[int]]]:
+        """Reads the bytes and shapes of a few samples from the chunk stored at `key`, without reading the whole chunk.
+        The header is read first (to find where the samples are), then each sample is read with a ranged request.
+
+        Note:
+            For random access of small samples in large chunks, this reads far less than `frombuffer` would need.
+                Reading many samples from the same chunk this way is slower than reading the chunk once.
+
+        Args:
+            storage (StorageProvider): Storage the chunk is stored in. Its `get_bytes` is used for the ranged reads.
+            key (str): Key of the chunk in `storage`.
+            local_sample_indices (Sequence[int]): Indices of the samples to read, relative to this chunk.
+
+        Raises:
+            ValueError: If the chunk stored at `key` ends before its header does.
+
+        Returns:
+            List[Tuple[bytes, Tuple[int]]]: The (possibly compressed) bytes and shape of each sample.
+        """
+
+        header = storage.get_bytes(key, 0, CHUNK_HEADER_PREFETCH_SIZE)
+        header_num_bytes = infer_chunk_header_num_bytes(header)
+        while header_num_bytes > len(header):
+            remainder = storage.get_bytes(key, len(header), header_num_bytes)
+            if not remainder:
+                raise ValueError(f"Chunk at '{key}' has an incomplete header.")
+            header = bytes(header) + bytes(remainder)
+            header_num_bytes = infer_chunk_header_num_bytes(header)
+
+        _, shapes, byte_positions, data_offset = deserialize_chunk_header(header)
+        shapes_encoder = ShapeEncoder(shapes)
+        byte_positions_encoder = BytePositionsEncoder(byte_positions)
+
+        samples = []
+        for local_sample_index in local_sample_indices:
+            shape = shapes_encoder[local_sample_index]
+            sb, eb = byte_positions_encoder[local_sample_index]
+            buffer = storage.get_bytes(key, data_offset + sb, data_offset + eb)
+            samples.append((buffer, shape))
+        return samples
@@ -1,27 +1,35 @@
-from hub.core.compression import decompress_array
+from hub.core.compression import (
+    compress_multiple,
+    downscale_array,
+    decompress_array,
+    decompress_multiple,
+)
+from functools import partial
 from math import ceil
-from typing import Optional, Sequence, Union, Tuple, List, Set
+import sys
+from typing import Callable, Iterable, Optional, Sequence, Union, Tuple, List, Set
 from hub.util.exceptions import (
     CorruptedMetaError,
     DynamicTensorNumpyError,
 )
 from hub.core.meta.tensor_meta import TensorMeta
-from hub.core.index.index import Index
+from hub.core.index.index import Index, IndexEntry
 from hub.util.keys import (
     get_chunk_key,
     get_chunk_id_encoder_key,
     get_tensor_meta_key,
 )
-from hub.core.sample import Sample  # type: ignore
-from hub.constants import DEFAULT_MAX_CHUNK_SIZE
+from hub.core.sample import Sample, compressed_bytes_multiple  # type: ignore
+from hub.constants import DEFAULT_MAX_CHUNK_SIZE, MAX_SAMPLES_FOR_PARTIAL_CHUNK_READ
 
 import numpy as np
 
 from hub.core.storage.lru_cache import LRUCache
 
 from hub.core.chunk import Chunk
+from hub.core.chunk_packing import plan_chunk_assignments
 
-from hub.core.meta.encode.chunk_id import ChunkIdEncoder
+from hub.core.meta.encode.chunk_id import ChunkIdEncoder, CHUNK_ID_COLUMN
 
 
 SampleValue = Union[np.ndarray, int, float, bool, Sample]
@@ -120,6 +128,14 @@ class ChunkEngine:
         self.min_chunk_size = self.max_chunk_size // 2
         self._meta_cache = meta_cache
 
+        # these keys are used on every append/read, `posixpath.join` is too slow to recompute them each time
+        self._tensor_meta_key = get_tensor_meta_key(key)
+        self._chunk_id_encoder_key = get_chunk_id_encoder_key(key)
+
+        # see `_sample_decoder`
+        self._decoder: Optional[Callable[[memoryview, Tuple[int]], np.ndarray]] = None
+        self._decoder_key: Optional[Tuple[Optional[str], Optional[str]]] = None
+
     @property
     def meta_cache(self) -> LRUCache:
         return self._meta_cache or self.cache
@@ -136,7 +152,7 @@ class ChunkEngine:
             ChunkIdEncoder: The chunk ID encoder handles the mapping between sample indices
                 and their corresponding chunks.
         """
-        key = get_chunk_id_encoder_key(self.key)
+        key = self._chunk_id_encoder_key
         if not self.chunk_id_encoder_exists:
 
             # 1 because we always update the meta information before writing the samples (to account for potentially corrupted data in the future)
@@ -155,8 +171,7 @@ class ChunkEngine:
     @property
     def chunk_id_encoder_exists(self) -> bool:
         try:
-            key = get_chunk_id_encoder_key(self.key)
-            self.meta_cache[key]
+            self.meta_cache[self._chunk_id_encoder_key]
             return True
         except KeyError:
             return False
@@ -188,8 +203,7 @@ class ChunkEngine:
 
     @property
     def tensor_meta(self):
-        tensor_meta_key = get_tensor_meta_key(self.key)
-        return self.meta_cache.get_cachable(tensor_meta_key, TensorMeta)
+        return self.meta_cache.get_cachable(self._tensor_meta_key, TensorMeta)
 
     def _append_bytes(self, buffer: memoryview, shape: Tuple[int], dtype: np.dtype):
         """Treat `buffer` as a single sample and place them into `Chunk`s. This function implements the algorithm for
@@ -207,34 +221,177 @@ class ChunkEngine:
         # num samples is always 1 when appending
         num_samples = 1
 
+        tensor_meta = self.tensor_meta
+
         # update tensor meta first because erroneous meta information is better than un-accounted for data.
-        buffer = self.tensor_meta.adapt(buffer, shape, dtype)
-        self.tensor_meta.update(shape, dtype, num_samples)
+        buffer = tensor_meta.adapt(buffer, shape, dtype)
+        tensor_meta.update(shape, dtype, num_samples)
 
         buffer_consumed = self._try_appending_to_last_chunk(buffer, shape)
         if not buffer_consumed:
             self._append_to_new_chunk(buffer, shape)
 
-        self.chunk_id_encoder.register_samples(num_samples)
-        self._synchronize_cache()
+        chunk_id_encoder = self.chunk_id_encoder
+        chunk_id_encoder.register_run(num_samples)
+        self._synchronize_cache(tensor_meta, chunk_id_encoder)
+
+    def _append_uniform_bytes(
+        self, buffer: memoryview, shape: Tuple[int], dtype: np.dtype, num_samples: int
+    ):
+        """Treat `buffer` as `num_samples` samples that all have the same `shape` and number of bytes, and place them into `Chunk`s.
+        Produces the same chunks as calling `_append_bytes` for every sample, but the number of samples that go into each chunk
+        is computed up front, so every chunk, header and meta is only updated once.
+
+        Args:
+            buffer (memoryview): Buffer that represents `num_samples` samples directly adjacent to one another.
+            shape (Tuple[int]): Shape for every sample that `buffer` represents.
+            dtype (np.dtype): Data type for the samples that `buffer` represents.
+            num_samples (int): Number of samples that `buffer` represents.
+        """
+
+        self.cache.check_readonly()
+
+        tensor_meta = self.tensor_meta
+
+        # the encoder has to be fetched before the tensor meta's length is updated (see `chunk_id_encoder`)
+        chunk_id_encoder = self.chunk_id_encoder
+
+        # update tensor meta first because erroneous meta information is better than un-accounted for data.
+        buffer = tensor_meta.adapt(buffer, shape, dtype)
+        tensor_meta.update(shape, dtype, num_samples)
+
+        num_bytes_per_sample = len(buffer) // num_samples
+        max_chunk_size = self.max_chunk_size
+        min_chunk_size = self.min_chunk_size
+
+        chunk, chunk_key = None, None
+        if chunk_id_encoder.num_chunks > 0:
+            chunk_key = get_chunk_key(self.key, chunk_id_encoder.get_name_for_chunk(-1))
+            chunk = self.cache.get_cachable(chunk_key, Chunk)
+
+        offset = 0
+        while num_samples > 0:
+            # same rule as `_try_appending_to_last_chunk`: a chunk keeps taking samples while it is under the min size
+            # and the sample still fits
+            num_fits = 0
+            if chunk is not None and chunk.is_under_min_space(min_chunk_size):
+                num_fits = _num_samples_that_fit(
+                    chunk.num_data_bytes,
+                    num_bytes_per_sample,
+                    min_chunk_size,
+                    max_chunk_size,
+                )
+
+            if num_fits == 0:
+                chunk, chunk_key = self._create_new_chunk(return_key=True)
+                num_fits = max(
+                    1,
+                    _num_samples_that_fit(
+                        0, num_bytes_per_sample, min_chunk_size, max_chunk_size
+                    ),
+                )
+
+            num_fits = min(num_fits, num_samples)
+            num_bytes = num_fits * num_bytes_per_sample
+
+            chunk.append_samples(  # type: ignore
+                buffer[offset : offset + num_bytes], max_chunk_size, shape, num_fits
+            )
+            chunk_id_encoder.register_run(num_fits)
+            self.cache.update_used_cache_for_path(chunk_key, chunk.nbytes)  # type: ignore
+
+            offset += num_bytes
+            num_samples -= num_fits
+
+        self._synchronize_cache(tensor_meta, chunk_id_encoder)
+
+    def _append_bytes_multiple(
+        self, buffers: Sequence[memoryview], shape: Tuple[int], dtype: np.dtype
+    ):
+        """Treat each of `buffers` as a single sample with the same `shape` (but not necessarily the same number of bytes),
+        and place them into `Chunk`s. Produces the same chunks as calling `_append_bytes` for every buffer, but which chunk
+        each buffer goes into is planned up front by `plan_chunk_assignments`, so the chunk ID encoder and meta are only
+        updated once per chunk.
+
+        Args:
+            buffers (Sequence[memoryview]): Buffers that each represent a single sample.
+            shape (Tuple[int]): Shape for every sample that `buffers` represent.
+            dtype (np.dtype): Data type for the samples that `buffers` represent.
+        """
+
+        num_samples = len(buffers)
+        if num_samples == 0:
+            return
+
+        self.cache.check_readonly()
+
+        tensor_meta = self.tensor_meta
+
+        # the encoder has to be fetched before the tensor meta's length is updated (see `chunk_id_encoder`)
+        chunk_id_encoder = self.chunk_id_encoder
+
+        # update tensor meta first because erroneous meta information is better than un-accounted for data.
+        buffers = [tensor_meta.adapt(buffer, shape, dtype) for buffer in buffers]
+        tensor_meta.update(shape, dtype, num_samples)
+
+        chunk, chunk_key = None, None
+        if chunk_id_encoder.num_chunks > 0:
+            chunk_key = get_chunk_key(self.key, chunk_id_encoder.get_name_for_chunk(-1))
+            chunk = self.cache.get_cachable(chunk_key, Chunk)
+
+        sample_sizes = np.fromiter(map(len, buffers), dtype=np.int64, count=num_samples)
+        assignments = plan_chunk_assignments(
+            sample_sizes,
+            chunk.num_data_bytes if chunk is not None else 0,
+            chunk is not None,
+            self.min_chunk_size,
+            self.max_chunk_size,
+        )
+
+        # boundaries between runs of buffers that go into the same chunk
+        bounds = [0, *(np.flatnonzero(np.diff(assignments)) + 1), num_samples]
+
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if assignments[start] > 0:
+                chunk, chunk_key = self._create_new_chunk(return_key=True)
+
+            chunk.append_samples_multiple(  # type: ignore
+                buffers[start:stop], self.max_chunk_size, shape
+            )
+
+            chunk_id_encoder.register_run(stop - start)
+            self.cache.update_used_cache_for_path(chunk_key, chunk.nbytes)  # type: ignore
 
-    def _synchronize_cache(self):
-        """Synchronizes cachables with the cache. Includes: the last chunk, tensor meta, and chunk IDs encoder."""
+        self._synchronize_cache(tensor_meta, chunk_id_encoder)
+
+    def _synchronize_cache(
+        self,
+        tensor_meta: Optional[TensorMeta] = None,
+        chunk_id_encoder: Optional[ChunkIdEncoder] = None,
+    ):
+        """Synchronizes cachables with the cache. Includes: the last chunk, tensor meta, and chunk IDs encoder.
+
+        Args:
+            tensor_meta (TensorMeta): Tensor meta to synchronize, if the caller already has it. Defaults to None (read from the cache).
+            chunk_id_encoder (ChunkIdEncoder): Chunk ID encoder to synchronize, if the caller already has it. Defaults to None (read from the cache).
+        """
+
+        tensor_meta = tensor_meta or self.tensor_meta
+        chunk_id_encoder = chunk_id_encoder or self.chunk_id_encoder
+        meta_cache = self.meta_cache
 
         # TODO implement tests for cache size compute
-        # TODO: optimize this by storing all of these keys in the chunk engine's state (posixpath.joins are pretty slow)
         # synchronize last chunk
-        last_chunk_key = self.last_chunk_key
-        last_chunk = self.last_chunk
+        last_chunk_name = chunk_id_encoder.get_name_for_chunk(-1)
+        last_chunk_key = get_chunk_key(self.key, last_chunk_name)
+        last_chunk = self.cache.get_cachable(last_chunk_key, Chunk)
         self.cache.update_used_cache_for_path(last_chunk_key, last_chunk.nbytes)  # type: ignore
 
         # synchronize tensor meta
-        tensor_meta_key = get_tensor_meta_key(self.key)
-        self.meta_cache[tensor_meta_key] = self.tensor_meta
+        meta_cache[self._tensor_meta_key] = tensor_meta
 
         # synchronize chunk ID encoder
-        chunk_id_key = get_chunk_id_encoder_key(self.key)
-        self.meta_cache[chunk_id_key] = self.chunk_id_encoder
+        meta_cache[self._chunk_id_encoder_key] = chunk_id_encoder
 
     def _try_appending_to_last_chunk(
         self, buffer: memoryview, shape: Tuple[int]
@@ -289,72 +446,177 @@ class ChunkEngine:
         new_chunk = self._create_new_chunk()
         new_chunk.append_sample(buffer, self.max_chunk_size, shape)
 
-    def _create_new_chunk(self):
-        """Creates and returns a new `Chunk`. Automatically creates an ID for it and puts a reference in the cache."""
+    def _create_new_chunk(self, return_key: bool = False):
+        """Creates and returns a new `Chunk`. Automatically creates an ID for it and puts a reference in the cache.
+        If `return_key` is True, the chunk's key is returned along with it. The previous last chunk won't be appended to
+        anymore, so if it is cached its unused capacity is dropped."""
 
-        chunk_id = self.chunk_id_encoder.generate_chunk_id()
+        chunk_id_encoder = self.chunk_id_encoder
+        if chunk_id_encoder.num_chunks > 0:
+            last_chunk_key = get_chunk_key(
+                self.key, chunk_id_encoder.get_name_for_chunk(-1)
+            )
+            if last_chunk_key in self.cache.lru_sizes:
+                last_chunk = self.cache.get_cachable(last_chunk_key, Chunk)
+                last_chunk.shrink_to_fit()
+                self.cache.update_used_cache_for_path(last_chunk_key, last_chunk.nbytes)
+
+        chunk_id = chunk_id_encoder.generate_chunk_id()
         chunk = Chunk()
         chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
         chunk_key = get_chunk_key(self.key, chunk_name)
         self.cache[chunk_key] = chunk
+
+        if return_key:
+            return chunk, chunk_key
         return chunk
 
     def extend(self, samples: Union[np.ndarray, Sequence[SampleValue]]):
         """Formats a batch of `samples` and feeds them into `_append_bytes`."""
 
         if isinstance(samples, np.ndarray):
-            compression = self.tensor_meta.sample_compression
-            if compression is None:
-                buffers = []
-
-                # before adding any data, we need to check all sample sizes
-                for sample in samples:
-                    buffer = memoryview(sample.tobytes())
-                    self._check_sample_size(len(buffer))
-                    buffers.append(buffer)
-
-                for buffer in buffers:
-                    self._append_bytes(buffer, sample.shape, sample.dtype)
-            else:
-                sample_objects = []
-                compression = self.tensor_meta.sample_compression
-
-                # before adding any data, we need to check all sample sizes
-                for sample in samples:
-                    sample_object = Sample(array=sample)
-                    sample_objects.append(sample_object)
-                    num_bytes = len(sample_object.compressed_bytes(compression))
-                    self._check_sample_size(num_bytes)
-
-                for sample_object in sample_objects:
-                    self.append(sample_object)
+            self._extend_arrays(samples)
 
         elif isinstance(samples, Sequence):
             if is_uniform_sequence(samples):
-                self.extend(np.array(samples))
+                if isinstance(samples[0], np.ndarray):
+                    # not stacked into a single array up front, see `_extend_arrays`
+                    self._extend_arrays(samples)
+                else:
+                    self._extend_arrays(np.array(samples))
             else:
-                for sample in samples:
-                    self.append(sample)
+                # every sample is serialized (and compressed) exactly once, and all of them are validated before any
+                # data is added
+                serialized = self._serialize_samples(samples, self.tensor_meta)
+
+                self._check_sample_sizes([buffer for buffer, _, _ in serialized])
+
+                for buffer, shape, dtype in serialized:
+                    self._append_bytes(buffer, shape, dtype)
         else:
             raise TypeError(f"Unsupported type for extending. Got: {type(samples)}")
 
         self.cache.maybe_flush()
 
+    def _extend_arrays(self, samples: Union[np.ndarray, Sequence[np.ndarray]]):
+        """Formats a batch of arrays that all have the same shape and feeds them into `_append_uniform_bytes` (uncompressed)
+        or `_append_bytes_multiple` (compressed).
+
+        Note:
+            `samples` may be a sequence of arrays instead of a single stacked array, in which case the whole batch is never
+                materialized at once. Compressed samples are compressed one by one, uncompressed samples are stacked in
+                groups of about one chunk's worth of data.
+
+        Args:
+            samples (Union[np.ndarray, Sequence[np.ndarray]]): Samples to append.
+        """
+
+        num_samples = len(samples)
+        if num_samples == 0:
+            return
+
+        tensor_meta = self.tensor_meta
+        compression = tensor_meta.sample_compression
+
+        if isinstance(samples, np.ndarray):
+            dtype = samples.dtype
+        else:
+            dtype = np.result_type(*{sample.dtype for sample in samples})
+
+        # all samples have the same shape, so it is only checked once if they have to be downscaled
+        max_side = _get_max_side(tensor_meta)
+        if max_side is not None and max(samples[0].shape[:2], default=0) > max_side:
+            samples = [downscale_array(sample, max_side) for sample in samples]
+
+        shape = samples[0].shape
+
+        # the whole batch is cast to the tensor's dtype once (while it is made contiguous, stacked or before it is compressed),
+        # so `TensorMeta.adapt` doesn't have to cast samples one by one. samples that can't be cast are left as is for
+        # `TensorMeta.adapt` to reject
+        if tensor_meta.dtype and np.can_cast(dtype, tensor_meta.dtype):
+            dtype = np.dtype(tensor_meta.dtype)
+
+        if compression is None:
+            # all samples have the same number of bytes, so they are appended as flat views over whole batches, chunk by chunk
+            num_bytes_per_sample = int(np.prod(shape)) * dtype.itemsize
+
+            # before adding any data, we need to check all sample sizes
+            self._check_sample_size(num_bytes_per_sample)
+
+            if isinstance(samples, np.ndarray):
+                batches: Iterable[np.ndarray] = [samples]
+            else:
+                batch_size = max(1, self.max_chunk_size // max(1, num_bytes_per_sample))
+                batches = _iterate_stacked(samples, batch_size, dtype)
+
+            for batch in batches:
+                flat = (
+                    np.ascontiguousarray(batch, dtype=dtype).reshape(-1).view(np.uint8)
+                )
+                self._append_uniform_bytes(memoryview(flat), shape, dtype, len(batch))
+
+        else:
+            # all samples are compressed in a single batch
+            quality = getattr(tensor_meta, "compression_quality", None)
+            if isinstance(samples, np.ndarray):
+                arrays = list(samples.astype(dtype, copy=False))
+            else:
+                arrays = [np.asarray(sample, dtype=dtype) for sample in samples]
+            buffers = compress_multiple(arrays, compression, quality)
+
+            # before adding any data, we need to check all sample sizes
+            self._check_sample_sizes(buffers)
+
+            self._append_bytes_multiple(list(map(memoryview, buffers)), shape, dtype)
+
     def append(self, sample: SampleValue):
         """Formats a single `sample` (compresseses/decompresses if applicable) and feeds it into `_append_bytes`."""
 
-        if isinstance(sample, Sample):
-            # has to decompress to read the array's shape and dtype
-            # might be able to optimize this away
-            compression = self.tensor_meta.sample_compression
-            data = memoryview(sample.compressed_bytes(compression))
-            self._check_sample_size(len(data))
-            self._append_bytes(data, sample.shape, sample.dtype)
-        else:
-            return self.append(Sample(array=np.array(sample)))
+        ((buffer, shape, dtype),) = self._serialize_samples([sample], self.tensor_meta)
+        self._check_sample_size(len(buffer))
+        self._append_bytes(buffer, shape, dtype)
 
         self.cache.maybe_flush()
 
+    def _serialize_samples(
+        self, samples: Sequence[SampleValue], tensor_meta: TensorMeta
+    ) -> List[Tuple[memoryview, Tuple[int], np.dtype]]:
+        """Converts `samples` into the bytes that are stored in chunks (compressed if applicable), along with their
+        shapes and dtypes. Samples that need to be compressed are compressed in a single batch.
+
+        Args:
+            samples (Sequence[SampleValue]): Samples to serialize.
+            tensor_meta (TensorMeta): Meta of this tensor, used for the compression, quality and max side settings.
+
+        Returns:
+            List[Tuple[memoryview, Tuple[int], np.dtype]]: Each sample's bytes, shape and dtype.
+        """
+
+        samples = [
+            sample if isinstance(sample, Sample) else Sample(array=np.array(sample))
+            for sample in samples
+        ]
+
+        # note: shapes and dtypes of samples that point to files are read from the file headers, so samples that are
+        # already compressed the right way are never decoded
+        max_side = _get_max_side(tensor_meta)
+        if max_side is not None:
+            samples = [
+                Sample(array=downscale_array(sample.array, max_side))
+                if max(sample.shape[:2], default=0) > max_side
+                else sample
+                for sample in samples
+            ]
+
+        compression = tensor_meta.sample_compression
+        quality = getattr(tensor_meta, "compression_quality", None)
+        buffers = compressed_bytes_multiple(samples, compression, quality)
+
+        return [
+            (memoryview(buffer), sample.shape, sample.dtype)
+            for buffer, sample in zip(buffers, samples)
+        ]
+
     def numpy(
         self, index: Index, aslist: bool = False
     ) -> Union[np.ndarray, Sequence[np.ndarray]]:
@@ -372,49 +634,200 @@ class ChunkEngine:
         """
 
         length = self.num_samples
-        enc = self.chunk_id_encoder
+        tensor_meta = self.tensor_meta
+        compression = tensor_meta.sample_compression
+        dtype = tensor_meta.dtype
+
+        global_sample_indices = np.fromiter(
+            index.values[0].indices(length), dtype=np.int64
+        )
+        num_samples = len(global_sample_indices)
+
         last_shape = None
+        buffers = []
+        shapes = []
         samples = []
 
-        for global_sample_index in index.values[0].indices(length):
-            chunk_id = enc[global_sample_index]
+        # uncompressed samples are written directly into a single output array when they are read as one
+        out = None
+        preallocate = compression is None and not aslist and num_samples > 0
+
+        position = 0
+        for chunk_key, local_sample_indices in self._iterate_chunks(
+            global_sample_indices
+        ):
+            stop = position + len(local_sample_indices)
+
+            if self._should_read_partially(chunk_key, len(local_sample_indices)):
+                # only the needed samples are read from storage, the chunk is not cached
+                chunk = None
+                samples_bytes = Chunk.read_samples_bytes(
+                    self.cache, chunk_key, local_sample_indices
+                )
+            else:
+                chunk = self.cache.get_cachable(chunk_key, Chunk)
+                samples_bytes = (
+                    _read_bytes_from_chunk(chunk, local_sample_index)
+                    for local_sample_index in local_sample_indices
+                )
+
+            if compression is None:
+                uniform_array = None if chunk is None else chunk.uniform_array(dtype)
+
+                if uniform_array is not None:
+                    shape = uniform_array.shape[1:]
+                    if not aslist and last_shape is not None and shape != last_shape:
+                        raise DynamicTensorNumpyError(self.key, index, "shape")
+                    last_shape = shape
+
+                    if preallocate:
+                        if out is None:
+                            out = np.empty((num_samples, *shape), dtype=dtype)
+                        np.take(
+                            uniform_array,
+                            local_sample_indices,
+                            axis=0,
+                            out=out[position:stop],
+                        )
+                    else:
+                        samples.extend(uniform_array[local_sample_indices])
+
+                else:
+                    for i, (buffer, shape) in enumerate(samples_bytes):
+                        shape = tuple(int(dim) for dim in shape)
+                        if (
+                            not aslist
+                            and last_shape is not None
+                            and shape != last_shape
+                        ):
+                            raise DynamicTensorNumpyError(self.key, index, "shape")
+                        last_shape = shape
+
+                        sample = np.frombuffer(buffer, dtype=dtype).reshape(shape)
+                        if preallocate:
+                            if out is None:
+                                out = np.empty((num_samples, *shape), dtype=dtype)
+                            out[position + i] = sample
+                        else:
+                            samples.append(sample)
+
+            else:
+                for buffer, shape in samples_bytes:
+                    if not aslist and last_shape is not None and shape != last_shape:
+                        raise DynamicTensorNumpyError(self.key, index, "shape")
+                    last_shape = shape
+
+                    buffers.append(buffer)
+                    shapes.append(shape)
+
+            position = stop
+
+        if compression is not None:
+            crops = _crops_from_index(index, shapes)
+            if crops is not None:
+                # the spatial part of `index` is applied while decoding
+                spatial_entries = [IndexEntry() for _ in index.values[1:3]]
+                index = Index([index.values[0], *spatial_entries, *index.values[3:]])
+
+            if not aslist and num_samples > 0:
+                # all samples have the same shape, so they are decoded directly into a single output array
+                sample_shape = tuple(int(dim) for dim in shapes[0])
+                if crops is not None:
+                    left, upper, right, lower = crops[0]
+                    sample_shape = (lower - upper, right - left, *sample_shape[2:])
+                out = np.empty((num_samples, *sample_shape), dtype=dtype)
+
+            # decode all samples in one batch
+            samples = decompress_multiple(buffers, shapes, compression, crops, out=out)
+
+        if out is not None:
+            return _format_array(out, index)
+
+        return _format_samples(samples, index, aslist)
+
+    def _iterate_chunks(self, global_sample_indices: np.ndarray):
+        """Groups `global_sample_indices` by the chunk their samples live in. Each chunk is only read from the cache once
+        per consecutive run of samples that belong to it.
+
+        Args:
+            global_sample_indices (np.ndarray): Indices of the samples to read, relative to the tensor.
+
+        Yields:
+            Tuple[str, np.ndarray]: The key of a chunk and the indices of the samples to read from it, relative to the chunk.
+        """
+
+        if len(global_sample_indices) == 0:
+            return
+
+        # the encoder's columns are read directly, so the chunk ID table is never copied
+        enc = self.chunk_id_encoder
+        last_seen = enc._last_index_col[: enc._length]
+        chunk_ids = enc._payload[: enc._length, CHUNK_ID_COLUMN]
+
+        # vectorized version of `ChunkIdEncoder.translate_index_relative_to_chunks`. the indices are searched with the
+        # encoder's dtype, so `np.searchsorted` doesn't cast `last_seen`
+        rows = np.searchsorted(last_seen, global_sample_indices.astype(last_seen.dtype))
+        chunk_starts = np.where(
+            rows > 0, last_seen[np.maximum(rows - 1, 0)].astype(np.int64) + 1, 0
+        )
+        local_sample_indices = global_sample_indices - chunk_starts
+
+        # boundaries between runs of samples that belong to the same chunk
+        bounds = [0, *(np.flatnonzero(np.diff(rows)) + 1), len(rows)]
+
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            chunk_id = chunk_ids[rows[start]]
             chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
             chunk_key = get_chunk_key(self.key, chunk_name)
-            chunk = self.cache.get_cachable(chunk_key, Chunk)
-            sample = self.read_sample_from_chunk(global_sample_index, chunk)
-            shape = sample.shape
+            yield chunk_key, local_sample_indices[start:stop]
 
-            if not aslist and last_shape is not None:
-                if shape != last_shape:
-                    raise DynamicTensorNumpyError(self.key, index, "shape")
+    def _should_read_partially(self, chunk_key: str, num_samples: int) -> bool:
+        """Determines if `num_samples` samples should be read from the chunk at `chunk_key` with ranged reads
+        (see `Chunk.read_samples_bytes`) instead of reading (and caching) the whole chunk.
 
-            samples.append(sample)
-            last_shape = shape
+        Note:
+            Only the first read of a chunk is partial. A chunk that was already read partially is likely to be read again
+                (for example when samples are read one by one), so from then on it is read as a whole and cached.
+        """
 
-        return _format_samples(samples, index, aslist)
+        if num_samples > MAX_SAMPLES_FOR_PARTIAL_CHUNK_READ:
+            return False
+
+        if chunk_key in self.cache.partially_read_keys:
+            return False
+
+        # cached chunks (including ones that were never flushed) are always read from the cache
+        return chunk_key not in self.cache.lru_sizes
+
+    def read_bytes_from_chunk(
+        self, global_sample_index: int, chunk: Chunk
+    ) -> Tuple[memoryview, Tuple[int]]:
+        """Read a sample's (possibly compressed) bytes and shape from a chunk, converts the global index into a local index."""
+
+        enc = self.chunk_id_encoder
+        local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
+        return _read_bytes_from_chunk(chunk, local_sample_index)
 
     def read_sample_from_chunk(
         self, global_sample_index: int, chunk: Chunk
     ) -> np.ndarray:
         """Read a sample from a chunk, converts the global index into a local index. Handles decompressing if applicable."""
 
-        expect_compressed = self.tensor_meta.sample_compression is not None
-        dtype = self.tensor_meta.dtype
+        decode = self._sample_decoder(self.tensor_meta)
+        buffer, shape = self.read_bytes_from_chunk(global_sample_index, chunk)
+        return decode(buffer, shape)
 
-        enc = self.chunk_id_encoder
+    def _sample_decoder(
+        self, tensor_meta: TensorMeta
+    ) -> Callable[[memoryview, Tuple[int]], np.ndarray]:
+        """Returns the decoder made by `_make_decoder` for this tensor's compression and dtype. It is only remade when
+        those change (for example, the dtype is set when the first sample is appended)."""
 
-        buffer = chunk.memoryview_data
-        local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
-        shape = chunk.shapes_encoder[local_sample_index]
-        sb, eb = chunk.byte_positions_encoder[local_sample_index]
-
-        buffer = buffer[sb:eb]
-        if expect_compressed:
-            sample = decompress_array(buffer, shape)
-        else:
-            sample = np.frombuffer(buffer, dtype=dtype).reshape(shape)
-
-        return sample
+        decoder_key = (tensor_meta.sample_compression, tensor_meta.dtype)
+        if decoder_key != self._decoder_key:
+            self._decoder = _make_decoder(*decoder_key)
+            self._decoder_key = decoder_key
+        return self._decoder  # type: ignore
 
     def _check_sample_size(self, num_bytes: int):
         if num_bytes > self.min_chunk_size:
@@ -425,6 +838,15 @@ class ChunkEngine:
 
             raise NotImplementedError(msg)
 
+    def _check_sample_sizes(self, buffers: Sequence[Union[bytes, memoryview]]):
+        """Same as `_check_sample_size` for every buffer in `buffers`, but the sizes are compared in a single vectorized pass.
+        The error is raised for the first buffer that is too large."""
+
+        sizes = np.fromiter(map(len, buffers), dtype=np.int64, count=len(buffers))
+        too_large = sizes > self.min_chunk_size
+        if too_large.any():
+            self._check_sample_size(int(sizes[np.argmax(too_large)]))
+
     def get_chunk_names(
         self, sample_index: int, last_index: int, target_chunk_count: int
     ) -> Set[str]:
@@ -472,6 +894,69 @@ class ChunkEngine:
             )
 
 
+def _get_max_side(tensor_meta: TensorMeta) -> Optional[int]:
+    """Returns the `max_side` that samples of a tensor are downscaled to, or None if they are not downscaled.
+    Only images are downscaled, so samples of tensors without a `sample_compression` never are."""
+
+    if tensor_meta.sample_compression is None:
+        return None
+    return getattr(tensor_meta, "max_side", None)
+
+
+def _iterate_stacked(
+    samples: Sequence[np.ndarray], batch_size: int, dtype: np.dtype
+) -> Iterable[np.ndarray]:
+    """Helper function for stacking `samples` (which all have the same shape) into arrays of up to `batch_size` samples.
+    All batches are written into the same buffer, so each batch is only valid until the next one is yielded."""
+
+    buffer = np.empty((min(batch_size, len(samples)), *samples[0].shape), dtype=dtype)
+
+    for start in range(0, len(samples), batch_size):
+        batch = samples[start : start + batch_size]
+        out = buffer[: len(batch)]
+        np.stack(batch, out=out)
+        yield out
+
+
+def _make_decoder(
+    compression: Optional[str], dtype: Optional[str]
+) -> Callable[[memoryview, Tuple[int]], np.ndarray]:
+    """Helper function for making a function that decodes a sample's bytes into an array, given the sample's shape.
+    `compression` and `dtype` are bound once, so decoding doesn't need to branch on them for every sample.
+
+    Note:
+        The decoder is a `functools.partial` of a module level function, so it can be pickled along with the engine.
+    """
+
+    if compression is None:
+        return partial(_decode_uncompressed, np.dtype(dtype))
+    return partial(_decode_compressed, compression)
+
+
+def _decode_uncompressed(
+    dtype: np.dtype, buffer: memoryview, shape: Tuple[int]
+) -> np.ndarray:
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+def _decode_compressed(
+    compression: str, buffer: memoryview, shape: Tuple[int]
+) -> np.ndarray:
+    return decompress_array(buffer, shape, compression)
+
+
+def _read_bytes_from_chunk(
+    chunk: Chunk, local_sample_index: int
+) -> Tuple[memoryview, Tuple[int]]:
+    """Helper function for reading a sample's bytes and shape from `chunk`, given its index relative to the chunk."""
+
+    buffer = chunk.memoryview_data
+    shape = chunk.shapes_encoder[local_sample_index]
+    sb, eb = chunk.byte_positions_encoder[local_sample_index]
+
+    return buffer[sb:eb], shape
+
+
 def _format_samples(
     samples: Sequence[np.array], index: Index, aslist: bool
 ) -> Union[np.ndarray, List[np.ndarray]]:
@@ -490,6 +975,76 @@ def _format_samples(
         return np.array(samples)
 
 
+def _format_array(array: np.ndarray, index: Index) -> np.ndarray:
+    """Helper function for applying `index` to `array`, where all samples were read into a single array.
+    Equivalent to `_format_samples(list(array), index, aslist=False)` without splitting `array` into samples."""
+
+    index_values = tuple(entry.value for entry in index.values[1:])
+    if any(isinstance(value, tuple) for value in index_values):
+        # advanced indexing over multiple axes is only equivalent when applied per sample
+        return _format_samples(list(array), index, aslist=False)
+
+    array = array[(slice(None), *index_values)]
+
+    # indexing a single scalar sample gives a numpy scalar, which is converted back into a 0-d array
+    return np.asarray(index.apply_squeeze(array))  # type: ignore
+
+
+def _crops_from_index(
+    index: Index, shapes: Sequence[Tuple[int]]
+) -> Optional[List[Tuple[int, int, int, int]]]:
+    """If `index` contiguously slices the first 2 axes (height and width) of the samples, returns a `(left, upper, right, lower)`
+    crop box for each of `shapes`, so only that region has to be decompressed. Otherwise returns None."""
+
+    spatial = [entry.value for entry in index.values[1:3]]
+    if not spatial or all(value == slice(None) for value in spatial):
+        return None
+
+    for value in spatial:
+        if not isinstance(value, slice) or value.step not in (None, 1):
+            return None
+
+    crops = []
+    for shape in shapes:
+        if len(shape) < 2:
+            return None
+
+        upper, lower, _ = spatial[0].indices(int(shape[0]))
+        left, right = 0, int(shape[1])
+        if len(spatial) > 1:
+            left, right, _ = spatial[1].indices(int(shape[1]))
+
+        if lower <= upper or right <= left:
+            # empty crops are left to `Index.apply`
+            return None
+
+        crops.append((left, upper, right, lower))
+
+    return crops
+
+
+def _num_samples_that_fit(
+    num_data_bytes: int,
+    num_bytes_per_sample: int,
+    min_chunk_size: int,
+    max_chunk_size: int,
+) -> int:
+    """Calculates how many samples of `num_bytes_per_sample` can be appended to a chunk holding `num_data_bytes`, where a sample
+    is only appended while the chunk is under `min_chunk_size` and the sample fits under `max_chunk_size`."""
+
+    if num_data_bytes >= min_chunk_size:
+        return 0
+
+    if num_bytes_per_sample == 0:
+        # empty samples never fill a chunk, but they only combine with a chunk that is empty too
+        # (see `_try_appending_to_last_chunk`)
+        return sys.maxsize if num_data_bytes == 0 else 0
+
+    under_min = ceil((min_chunk_size - num_data_bytes) / num_bytes_per_sample)
+    under_max = (max_chunk_size - num_data_bytes) // num_bytes_per_sample
+    return min(under_min, under_max)
+
+
 def _min_chunk_ct_for_data_size(chunk_max_data_bytes: int, size: int) -> int:
     """Calculates the minimum number of chunks in which data of given size can be fit."""
     return ceil(size / chunk_max_data_bytes)
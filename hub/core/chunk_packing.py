@@ -0,0 +1,64 @@
+import numpy as np
+
+from hub.util.jit import njit
+
+
+@njit(cache=True)
+def plan_chunk_assignments(
+    sample_sizes: np.ndarray,
+    last_chunk_size: int,
+    has_last_chunk: bool,
+    min_chunk_size: int,
+    max_chunk_size: int,
+) -> np.ndarray:
+    """Decides which chunk each sample of a batch is appended to, without touching any `Chunk`s.
+    Follows the same rule as `ChunkEngine._try_appending_to_last_chunk`: a sample is appended to the current chunk if the chunk
+    is under `min_chunk_size` and appending does not increase the number of chunks the data needs. Otherwise a new chunk is started.
+
+    Note:
+        This is compiled with numba when it is installed, since it runs once per sample.
+
+    Example:
+        >>> plan_chunk_assignments(np.array([10, 10, 10]), 5, True, 16, 32)
+        array([0, 0, 1])
+
+    Args:
+        sample_sizes (np.ndarray): Number of bytes for each sample, in the order they are appended.
+        last_chunk_size (int): Number of data bytes in the last existing chunk.
+        has_last_chunk (bool): If False, `last_chunk_size` is ignored and the first sample starts a new chunk.
+        min_chunk_size (int): Chunks stop accepting samples once they reach this many bytes.
+        max_chunk_size (int): Chunks never exceed this many bytes.
+
+    Returns:
+        np.ndarray: For each sample, 0 if it goes into the last existing chunk, otherwise `k` for the `k`-th new chunk.
+    """
+
+    num_samples = len(sample_sizes)
+    assignments = np.empty(num_samples, dtype=np.int64)
+
+    chunk_index = 0
+    chunk_size = last_chunk_size
+    if not has_last_chunk:
+        # a full chunk never accepts samples, so the first sample goes into a new chunk
+        chunk_size = min_chunk_size
+
+    for i in range(num_samples):
+        size = sample_sizes[i]
+
+        fits = False
+        if chunk_size < min_chunk_size:
+            # the number of chunks needed for the sample alone vs. combined with the current chunk
+            content_chunk_ct = (size + max_chunk_size - 1) // max_chunk_size
+            combined_chunk_ct = (
+                size + chunk_size + max_chunk_size - 1
+            ) // max_chunk_size
+            fits = content_chunk_ct == combined_chunk_ct
+
+        if not fits:
+            chunk_index += 1
+            chunk_size = 0
+
+        assignments[i] = chunk_index
+        chunk_size += size
+
+    return assignments
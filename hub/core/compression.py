@@ -1,15 +1,61 @@
-from hub.constants import SUPPORTED_COMPRESSIONS
+from hub.constants import SUPPORTED_COMPRESSIONS, DEFAULT_JPEG_QUALITY
 from hub.util.exceptions import (
     SampleCompressionError,
     SampleDecompressionError,
     UnsupportedCompressionError,
 )
-from typing import Union, Tuple
+from typing import List, Optional, Sequence, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
 import numpy as np
 
 from PIL import Image, UnidentifiedImageError  # type: ignore
 from io import BytesIO
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_GRAY, TJPF_RGB, TJSAMP_GRAY, TJSAMP_420, tjMCUWidth, tjMCUHeight  # type: ignore
+
+    # a single instance is shared, creating one loads the libjpeg-turbo library
+    _TURBOJPEG = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # `PyTurboJPEG` is not installed, or it could not find the libjpeg-turbo shared library
+    _TURBOJPEG = None
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_pid: Optional[int] = None
+
+# holds a `BytesIO` per thread that is reused for every `PIL` decode
+_thread_local = threading.local()
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    """Returns a thread pool shared by all batched compression functions. A new pool is created after a fork,
+    since the threads of the parent process don't exist in the child."""
+
+    global _thread_pool, _thread_pool_pid
+
+    if _thread_pool is None or _thread_pool_pid != os.getpid():
+        _thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        _thread_pool_pid = os.getpid()
+
+    return _thread_pool
+
+
+def _reusable_bytes_io(buffer: Union[bytes, memoryview]) -> BytesIO:
+    """Returns this thread's `BytesIO`, rewound and holding only `buffer`. Avoids allocating a new `BytesIO` for every
+    decoded sample. The returned object is only valid until the next call from the same thread."""
+
+    bio = getattr(_thread_local, "bytes_io", None)
+    if bio is None:
+        bio = _thread_local.bytes_io = BytesIO()
+
+    bio.seek(0)
+    bio.truncate()
+    bio.write(buffer)
+    bio.seek(0)
+    return bio
+
 
 def to_image(array: np.ndarray) -> Image:
     shape = array.shape
@@ -20,7 +66,31 @@ def to_image(array: np.ndarray) -> Image:
     return Image.fromarray(array)
 
 
-def compress_array(array: np.ndarray, compression: str) -> bytes:
+def downscale_array(array: np.ndarray, max_side: int) -> np.ndarray:
+    """Downscales an image array so that neither its height nor width exceed `max_side`, preserving the aspect ratio.
+
+    Args:
+        array (np.ndarray): Image array with shape `(height, width, ...)`. Has to be compatible with `PIL`.
+        max_side (int): Maximum height and width of the returned array.
+
+    Returns:
+        np.ndarray: The downscaled array, or `array` itself if it already fits.
+    """
+
+    if max(array.shape[:2]) <= max_side:
+        return array
+
+    img = to_image(array)
+    img.thumbnail((max_side, max_side), Image.LANCZOS)
+    downscaled = np.asarray(img)
+
+    # `to_image` squeezes (X,Y,1) grayscale arrays, restore the channel axis
+    return downscaled.reshape(*downscaled.shape[:2], *array.shape[2:])
+
+
+def compress_array(
+    array: np.ndarray, compression: str, quality: Optional[int] = None
+) -> Union[bytes, memoryview]:
     """Compress some numpy array using `compression`. All meta information will be contained in the returned buffer.
 
     Note:
@@ -29,13 +99,16 @@ def compress_array(array: np.ndarray, compression: str) -> bytes:
     Args:
         array (np.ndarray): Array to be compressed.
         compression (str): `array` will be compressed with this compression into bytes. Right now only arrays compatible with `PIL` will be compressed.
+        quality (int, optional): Quality (1-100) for lossy compressions like jpeg. Ignored by lossless compressions.
+            Defaults to None (`DEFAULT_JPEG_QUALITY`).
 
     Raises:
         UnsupportedCompressionError: If `compression` is unsupported. See `SUPPORTED_COMPRESSIONS`.
         SampleCompressionError: If there was a problem compressing `array`.
 
     Returns:
-        bytes: Compressed `array` represented as bytes.
+        Union[bytes, memoryview]: Compressed `array` represented as bytes. Buffers encoded by `PIL` are returned as a
+            memoryview over the encoder's output, so they aren't copied.
     """
 
     if compression not in SUPPORTED_COMPRESSIONS:
@@ -44,27 +117,83 @@ def compress_array(array: np.ndarray, compression: str) -> bytes:
     if compression is None:
         return array.tobytes()
 
+    if compression == "jpeg" and _turbojpeg_can_encode(array):
+        try:
+            return _turbojpeg_encode(array, quality)
+        except OSError as e:
+            raise SampleCompressionError(array.shape, compression, str(e))
+
+    save_kwargs = {}
+    if compression == "jpeg":
+        save_kwargs["quality"] = quality or DEFAULT_JPEG_QUALITY
+
     try:
         img = to_image(array)
         out = BytesIO()
-        img.save(out, compression)
-        out.seek(0)
-        return out.read()
+        img.save(out, compression, **save_kwargs)
+        return out.getbuffer()
     except (TypeError, OSError) as e:
         raise SampleCompressionError(array.shape, compression, str(e))
 
 
-def decompress_array(buffer: Union[bytes, memoryview], shape: Tuple[int]) -> np.ndarray:
+def compress_multiple(
+    arrays: Sequence[np.ndarray], compression: str, quality: Optional[int] = None
+) -> List[Union[bytes, memoryview]]:
+    """Compress a batch of arrays using `compression`. See `compress_array` for more information.
+
+    Note:
+        Arrays are encoded concurrently with a thread pool, both libjpeg-turbo and `PIL` release the GIL while encoding.
+
+    Args:
+        arrays (Sequence[np.ndarray]): Arrays to be compressed.
+        compression (str): All `arrays` will be compressed with this compression into bytes.
+        quality (int, optional): Quality for lossy compressions. See `compress_array`. Defaults to None.
+
+    Returns:
+        List[Union[bytes, memoryview]]: Compressed `arrays` represented as bytes, in the same order as `arrays`.
+    """
+
+    if compression is None or len(arrays) <= 1:
+        return [compress_array(array, compression, quality) for array in arrays]
+
+    # `map` re-raises the first exception raised by any of the workers
+    return list(
+        _get_thread_pool().map(
+            lambda array: compress_array(array, compression, quality), arrays
+        )
+    )
+
+
+def decompress_array(
+    buffer: Union[bytes, memoryview],
+    shape: Tuple[int],
+    compression: Optional[str] = None,
+    crop: Optional[Tuple[int, int, int, int]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """Decompress some buffer into a numpy array. It is expected that all meta information is
     stored inside `buffer`.
 
     Note:
         `compress_array` may be used to get the `buffer` input.
+        If `compression` is "jpeg" and `PyTurboJPEG` is installed, libjpeg-turbo is used to decode `buffer` directly.
+            Otherwise `PIL` is used. The two decoders don't produce identical pixels for lossy jpegs, so installing or
+            removing `PyTurboJPEG` slightly changes the values read from jpegs that are already stored.
+        When `crop` is provided with libjpeg-turbo, only the blocks that overlap the crop region are decoded. The crop is
+            decoded on its own, so pixels near its right and bottom edges (chroma upsampling and IDCT) are only approximately
+            equal to the same pixels of a full decode.
 
     Args:
         buffer (bytes, memoryview): Buffer to be decompressed. It is assumed all meta information required to
             decompress is contained within `buffer`.
         shape (Tuple[int]): Desired shape of decompressed object. Reshape will attempt to match this shape before returning.
+        compression (str, optional): Compression `buffer` is expected to be in. Used to pick the fastest available decoder.
+            Defaults to None (decoder is inferred by `PIL`).
+        crop (Tuple[int, int, int, int], optional): Non-empty `(left, upper, right, lower)` box of the sample to decompress.
+            The returned array is the same as `decompress_array(buffer, shape)[upper:lower, left:right]`, except for lossy
+            jpegs decoded with libjpeg-turbo, where it is only approximately equal (see the note above). Defaults to None.
+        out (np.ndarray, optional): If provided, the decompressed array is written into `out` (which must have the decompressed
+            shape) and `out` is returned. Useful for decompressing a batch into a single preallocated array. Defaults to None.
 
     Raises:
         SampleDecompressionError: Right now only buffers compatible with `PIL` will be decompressed.
@@ -73,8 +202,134 @@ def decompress_array(buffer: Union[bytes, memoryview], shape: Tuple[int]) -> np.
         np.ndarray: Array from the decompressed buffer.
     """
 
-    try:
-        img = Image.open(BytesIO(buffer))
-        return np.array(img).reshape(shape)
-    except UnidentifiedImageError:
-        raise SampleDecompressionError()
+    if crop is not None:
+        left, upper, right, lower = crop
+        shape = (lower - upper, right - left, *shape[2:])
+
+    array = None
+    if compression == "jpeg" and _TURBOJPEG is not None:
+        pixel_format = _turbojpeg_pixel_format(shape)
+        if pixel_format is not None:
+            try:
+                array = _turbojpeg_decode(buffer, pixel_format, crop)
+            except OSError:
+                raise SampleDecompressionError()
+
+    if array is None:
+        try:
+            img = Image.open(_reusable_bytes_io(buffer))
+            if crop is not None:
+                img = img.crop(crop)
+
+            # when decoding into `out`, `np.asarray` wraps the decoded pixels without copying them again (the result is
+            # read-only). arrays that are returned to the caller have to be writable, so they are copied
+            array = np.asarray(img) if out is not None else np.array(img)
+        except UnidentifiedImageError:
+            raise SampleDecompressionError()
+
+    array = array.reshape(shape)
+
+    if out is not None:
+        out[...] = array
+        return out
+
+    return array
+
+
+def decompress_multiple(
+    buffers: Sequence[Union[bytes, memoryview]],
+    shapes: Sequence[Tuple[int]],
+    compression: Optional[str] = None,
+    crops: Optional[Sequence[Tuple[int, int, int, int]]] = None,
+    out: Optional[np.ndarray] = None,
+) -> Union[List[np.ndarray], np.ndarray]:
+    """Decompress a batch of buffers into numpy arrays. See `decompress_array` for more information.
+
+    Note:
+        Buffers are decoded concurrently with a thread pool.
+
+    Args:
+        buffers (Sequence): Buffers to be decompressed.
+        shapes (Sequence): Desired shape for each decompressed buffer.
+        compression (str, optional): Compression all `buffers` are expected to be in. Defaults to None.
+        crops (Sequence, optional): Crop box for each buffer. Defaults to None (no cropping).
+        out (np.ndarray, optional): If provided, buffer `i` is decompressed into `out[i]` and `out` is returned.
+            All decompressed arrays must have the same shape. Defaults to None.
+
+    Returns:
+        Union[List[np.ndarray], np.ndarray]: Arrays from the decompressed buffers, in the same order as `buffers`.
+            If `out` is provided, `out` is returned instead.
+    """
+
+    if crops is None:
+        crops = [None] * len(buffers)
+
+    def _decompress(i: int) -> np.ndarray:
+        sample_out = None if out is None else out[i]
+        return decompress_array(buffers[i], shapes[i], compression, crops[i], sample_out)  # type: ignore
+
+    if len(buffers) <= 1:
+        arrays = list(map(_decompress, range(len(buffers))))
+    else:
+        # decoders release the GIL, so buffers are decoded concurrently. `map` re-raises the first exception raised by any of the workers
+        arrays = list(_get_thread_pool().map(_decompress, range(len(buffers))))
+
+    if out is not None:
+        return out
+
+    return arrays
+
+
+def _turbojpeg_decode(
+    buffer: Union[bytes, memoryview],
+    pixel_format: int,
+    crop: Optional[Tuple[int, int, int, int]] = None,
+) -> np.ndarray:
+    if crop is None:
+        return _TURBOJPEG.decode(buffer, pixel_format=pixel_format)
+
+    left, upper, right, lower = crop
+    _, _, subsample, _ = _TURBOJPEG.decode_header(buffer)
+
+    # lossless crops have to start on an MCU boundary, so the region is expanded to the
+    # closest boundary and the extra pixels are sliced off after decoding
+    x = left - left % tjMCUWidth[subsample]
+    y = upper - upper % tjMCUHeight[subsample]
+    cropped = _TURBOJPEG.crop(buffer, x, y, right - x, lower - y)
+    array = _TURBOJPEG.decode(cropped, pixel_format=pixel_format)
+    return array[upper - y : lower - y, left - x : right - x]
+
+
+def _turbojpeg_can_encode(array: np.ndarray) -> bool:
+    return (
+        _TURBOJPEG is not None
+        and array.dtype == np.uint8
+        and _turbojpeg_pixel_format(array.shape) is not None
+    )
+
+
+def _turbojpeg_encode(array: np.ndarray, quality: Optional[int] = None) -> bytes:
+    pixel_format = _turbojpeg_pixel_format(array.shape)
+
+    if pixel_format == TJPF_GRAY:
+        array = array.reshape(*array.shape[:2], 1)
+        subsample = TJSAMP_GRAY
+    else:
+        subsample = TJSAMP_420
+
+    return _TURBOJPEG.encode(
+        np.ascontiguousarray(array),
+        quality=quality or DEFAULT_JPEG_QUALITY,
+        pixel_format=pixel_format,
+        jpeg_subsample=subsample,
+    )
+
+
+def _turbojpeg_pixel_format(shape: Tuple[int]) -> Optional[int]:
+    """Returns the libjpeg-turbo pixel format for samples of `shape`, or None if libjpeg-turbo can't decode them."""
+
+    if len(shape) == 2 or (len(shape) == 3 and shape[2] == 1):
+        return TJPF_GRAY
+    if len(shape) == 3 and shape[2] == 3:
+        return TJPF_RGB
+    return None
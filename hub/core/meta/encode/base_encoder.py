@@ -1,6 +1,10 @@
 from abc import ABC
+from array import array
+from bisect import bisect_left
 from typing import Any, Sequence
 from hub.constants import ENCODING_DTYPE
+from hub.util.exceptions import EncodingOverflowError
+from hub.util.jit import njit, numba_installed
 import numpy as np
 
 
@@ -8,6 +12,43 @@ import numpy as np
 # this is the column that is binary searched over
 LAST_SEEN_INDEX_COLUMN = -1
 
+# without numba, encodings with fewer rows than this are searched with `bisect` (which is faster than `np.searchsorted`'s
+# fixed overhead for small inputs) and larger ones with `np.searchsorted`
+BISECT_MAX_ROWS = 4096
+
+# largest value that can be stored in an encoding. numpy wraps around silently when larger values are written
+ENCODING_MAX = int(np.iinfo(ENCODING_DTYPE).max)
+
+
+@njit(cache=True)
+def _find_row(
+    last_index_col: np.ndarray, length: int, local_sample_index: int, hint: int
+) -> int:
+    """Finds the first row in `last_index_col[:length]` whose last seen index is >= `local_sample_index`.
+    Returns `length` if there is none.
+
+    Note:
+        Sequential lookups usually hit the same row as the previous lookup, or the one after it, so the rows
+            `hint` and `hint + 1` are checked before binary searching.
+        This is compiled with numba when it is installed, since it runs once per lookup.
+    """
+
+    for row_index in range(hint, min(hint + 2, length)):
+        if local_sample_index <= last_index_col[row_index] and (
+            row_index == 0 or local_sample_index > last_index_col[row_index - 1]
+        ):
+            return row_index
+
+    low = 0
+    high = length
+    while low < high:
+        mid = (low + high) // 2
+        if last_index_col[mid] < local_sample_index:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
 
 class Encoder(ABC):
     def __init__(self, encoded=None):
@@ -22,7 +63,9 @@ class Encoder(ABC):
         You can find all of this information in their respective classes.
 
         Layout:
-            `_encoded` is a 2D array.
+            `_encoded` is a 2D array. It is stored as two arrays with spare capacity for appending rows: `_payload` holds every
+                column except `LAST_SEEN_INDEX_COLUMN`, and `_last_index_col` holds `LAST_SEEN_INDEX_COLUMN`. Lookups only
+                binary search `_last_index_col`, and values are only read from `_payload`.
 
             Best case scenario:
                 The best case scenario is when all samples have the same meta and can thus be stored in a single row,
@@ -41,9 +84,52 @@ class Encoder(ABC):
             encoded (np.ndarray): Encoded state, if None state is empty. Helpful for deserialization. Defaults to None.
         """
 
+        if encoded is None:
+            encoded = np.array([], dtype=ENCODING_DTYPE)
         self._encoded = encoded
-        if self._encoded is None:
-            self._encoded = np.array([], dtype=ENCODING_DTYPE)
+
+    @property
+    def _encoded(self) -> np.ndarray:
+        """The encoded state as a single 2D array. This is assembled from `self._payload` and `self._last_index_col`, so it is
+        a copy. It is read-only, since writing to it would not change the encoded state. Assign to `_encoded` instead."""
+
+        length = self._length
+        if length == 0:
+            encoded = np.array([], dtype=ENCODING_DTYPE)
+        else:
+            encoded = np.column_stack(
+                (self._payload[:length], self._last_index_col[:length])
+            )
+        encoded.setflags(write=False)
+        return encoded
+
+    @_encoded.setter
+    def _encoded(self, encoded: np.ndarray):
+        self._length = len(encoded)
+
+        # only the first `self._length` rows of both arrays are valid, the rest is spare capacity (see `_reserve_rows`)
+        if len(encoded) == 0:
+            self._payload = np.array([], dtype=ENCODING_DTYPE)
+            self._last_index_col = np.array([], dtype=ENCODING_DTYPE)
+        else:
+            self._payload = np.array(
+                encoded[:, :LAST_SEEN_INDEX_COLUMN], dtype=ENCODING_DTYPE
+            )
+            self._last_index_col = np.array(
+                encoded[:, LAST_SEEN_INDEX_COLUMN], dtype=ENCODING_DTYPE
+            )
+
+        # the same column as python ints, for `bisect` (see `translate_index`)
+        self._last_index_array = array("Q", self._last_index_col.tolist())
+
+        # row that the last `translate_index` call returned, checked before binary searching
+        self._last_row_hint = 0
+
+        # `num_samples` is needed for every append and lookup, so it is cached instead of being read from the array
+        if len(encoded) == 0:
+            self._num_samples = 0
+        else:
+            self._num_samples = int(self._last_index_col[-1]) + 1
 
     @property
     def array(self):
@@ -51,13 +137,16 @@ class Encoder(ABC):
 
     @property
     def nbytes(self):
-        return self.array.nbytes
+        if self._length == 0:
+            return 0
+
+        # same as `self.array.nbytes`, without assembling the array
+        num_columns = self._payload.shape[1] + 1
+        return self._length * num_columns * self._last_index_col.itemsize
 
     @property
     def num_samples(self) -> int:
-        if len(self._encoded) == 0:
-            return 0
-        return int(self._encoded[-1, LAST_SEEN_INDEX_COLUMN] + 1)
+        return self._num_samples
 
     def num_samples_at(self, translated_index: int) -> int:
         """Calculates the number of samples a row in the encoding corresponds to.
@@ -70,11 +159,9 @@ class Encoder(ABC):
         """
 
         lower_bound = 0
-        if len(self._encoded) > 1 and translated_index > 0:
-            lower_bound = (
-                self._encoded[translated_index - 1, LAST_SEEN_INDEX_COLUMN] + 1
-            )
-        upper_bound = self._encoded[translated_index, LAST_SEEN_INDEX_COLUMN] + 1
+        if self._length > 1 and translated_index > 0:
+            lower_bound = self._last_index_col[translated_index - 1] + 1
+        upper_bound = self._last_index_col[translated_index] + 1
 
         return int(upper_bound - lower_bound)
 
@@ -92,19 +179,35 @@ class Encoder(ABC):
             int: The index of the corresponding row inside the encoded state.
         """
 
-        # TODO: optimize this (should accept an optional argument for starting point, instead of random binsearch)
-
-        if self.num_samples == 0:
+        num_samples = self._num_samples
+        if num_samples == 0:
             raise IndexError(
                 f"Index {local_sample_index} is out of bounds for an empty byte position encoding."
             )
 
         if local_sample_index < 0:
-            local_sample_index += self.num_samples
+            local_sample_index += num_samples
+
+        if numba_installed:
+            row_index = _find_row(
+                self._last_index_col,
+                self._length,
+                local_sample_index,
+                self._last_row_hint,
+            )
+        elif self._length < BISECT_MAX_ROWS:
+            row_index = bisect_left(self._last_index_array, local_sample_index)
+        else:
+            row_index = int(
+                np.searchsorted(
+                    self._last_index_col[: self._length], local_sample_index
+                )
+            )
 
-        return np.searchsorted(
-            self._encoded[:, LAST_SEEN_INDEX_COLUMN], local_sample_index
-        )
+        # out of bounds indices are not remembered (indexing with them raises an `IndexError` later)
+        if row_index < self._length:
+            self._last_row_hint = row_index
+        return row_index
 
     def register_samples(self, item: Any, num_samples: int):
         """Register `num_samples` as `item`. Combines when the `self._combine_condition` returns True.
@@ -121,29 +224,140 @@ class Encoder(ABC):
 
         if self.num_samples != 0:
             if self._combine_condition(item):
-                last_index = self._encoded[-1, LAST_SEEN_INDEX_COLUMN]
-                new_last_index = self._derive_next_last_index(last_index, num_samples)
-
-                self._encoded[-1, LAST_SEEN_INDEX_COLUMN] = new_last_index
+                self._extend_last_row(num_samples)
 
             else:
                 decomposable = self._make_decomposable(item)
 
-                last_index = self._encoded[-1, LAST_SEEN_INDEX_COLUMN]
+                last_index = int(self._last_index_col[self._length - 1])
                 next_last_index = self._derive_next_last_index(last_index, num_samples)
 
-                shape_entry = np.array(
-                    [[*decomposable, next_last_index]], dtype=ENCODING_DTYPE
-                )
-
-                self._encoded = np.concatenate([self._encoded, shape_entry], axis=0)
+                self._append_row(decomposable, next_last_index)
 
         else:
             decomposable = self._make_decomposable(item)
-            self._encoded = np.array(
-                [[*decomposable, num_samples - 1]], dtype=ENCODING_DTYPE
+            self._append_row(decomposable, num_samples - 1)
+
+    def register_run(self, item: Any, num_samples: int):
+        """Registers `num_samples` more samples as `item`, where the caller already knows that `item` combines with the last row.
+        Unlike `register_samples`, neither `self._validate_incoming_item` nor `self._combine_condition` are called, so this is
+        O(1) regardless of how expensive those checks are.
+
+        Args:
+            item (Any): General input. Must be combinable with the last row, this is not checked.
+            num_samples (int): Number of samples that have `item`'s value. Must be valid for `item`, this is not checked.
+
+        Raises:
+            ValueError: If there is no last row to combine with.
+        """
+
+        if self._length == 0:
+            raise ValueError(
+                "Cannot register a run when there are no samples to combine with."
             )
 
+        self._extend_last_row(num_samples)
+
+    def register_samples_bulk(self, items: Sequence, counts: Sequence[int]):
+        """Registers `counts[i]` samples as `items[i]` for every `i`. Produces the same encoding as calling `register_samples`
+        for each pair in order. Subclasses may override this with a vectorized implementation.
+
+        Args:
+            items (Sequence): General inputs, will be passed along to subclass methods.
+            counts (Sequence[int]): Number of samples that have each of `items`' values.
+        """
+
+        for item, num_samples in zip(items, counts):
+            self.register_samples(item, num_samples)
+
+    def _reserve_rows(self, num_rows: int, num_columns: int):
+        """Makes sure `self._payload` and `self._last_index_col` can hold at least `num_rows` rows.
+
+        Note:
+            Only the first `self._length` rows are valid. When the arrays are full, their capacity is doubled, so appending
+                a row is amortized O(1) instead of copying every existing row.
+        """
+
+        if num_rows <= len(self._last_index_col):
+            return
+
+        length = self._length
+        capacity = max(8, 2 * length, num_rows)
+
+        payload = np.empty((capacity, num_columns - 1), dtype=ENCODING_DTYPE)
+        last_index_col = np.empty(capacity, dtype=ENCODING_DTYPE)
+
+        # note: an empty encoding is a 1D array, so there is nothing to copy
+        if length > 0:
+            payload[:length] = self._payload[:length]
+            last_index_col[:length] = self._last_index_col[:length]
+
+        self._payload = payload
+        self._last_index_col = last_index_col
+
+    def _append_row(self, decomposable: Sequence, last_index: int):
+        """Appends the row `[*decomposable, last_index]` to `self._encoded`. The values are stored directly into the spare
+        capacity, without building an intermediate array for the row."""
+
+        self._check_encodable(max((last_index, *decomposable)))
+
+        length = self._length
+        self._reserve_rows(length + 1, len(decomposable) + 1)
+
+        self._payload[length] = decomposable
+        self._last_index_col[length] = last_index
+        self._length = length + 1
+        self._sync_last_row()
+
+    def _append_rows(self, rows: np.ndarray):
+        """Appends all of `rows` (a 2D integer array) to `self._encoded` at once."""
+
+        length = self._length
+        num_rows = len(rows)
+        if num_rows == 0:
+            return
+
+        self._check_encodable(rows.max())
+
+        self._reserve_rows(length + num_rows, rows.shape[1])
+
+        self._payload[length : length + num_rows] = rows[:, :LAST_SEEN_INDEX_COLUMN]
+        self._last_index_col[length : length + num_rows] = rows[
+            :, LAST_SEEN_INDEX_COLUMN
+        ]
+        self._last_index_array.extend(rows[:-1, LAST_SEEN_INDEX_COLUMN].tolist())
+        self._length = length + num_rows
+        self._sync_last_row()
+
+    def _extend_last_row(self, num_samples: int):
+        """Adds `num_samples` to the last row of `self._encoded`."""
+
+        last_index = int(self._last_index_col[self._length - 1])
+        new_last_index = self._derive_next_last_index(last_index, num_samples)
+        self._check_encodable(new_last_index)
+
+        self._last_index_col[self._length - 1] = new_last_index
+        self._sync_last_row()
+
+    def _check_encodable(self, value: int):
+        """Raises `EncodingOverflowError` if `value` is too large for `ENCODING_DTYPE`. Should be called with the largest value
+        of a write before anything is written, so the encoded state is left unchanged."""
+
+        if value > ENCODING_MAX:
+            raise EncodingOverflowError(int(value), ENCODING_MAX)
+
+    def _sync_last_row(self):
+        """Updates the state derived from the last row of `self._encoded` after it was written to."""
+
+        last_index = self._last_index_col[self._length - 1]
+        self._num_samples = int(last_index) + 1
+
+        # the last row is either new or was just updated
+        if len(self._last_index_array) < self._length:
+            self._last_index_array.append(int(last_index))
+        else:
+            self._last_index_array[-1] = int(last_index)
+
     def _validate_incoming_item(self, item: Any, num_samples: int):
         """Raises appropriate exceptions for when `item` or `num_samples` are invalid.
         Subclasses should override this method when applicable.
@@ -172,9 +386,11 @@ class Encoder(ABC):
         return item
 
     def _derive_value(
-        self, row: np.ndarray, row_index: int, local_sample_index: int
+        self, payload: np.ndarray, row_index: int, local_sample_index: int
     ) -> np.ndarray:
-        """Given a row of `self._encoded`, this method should implement how `__getitem__` hands a value to the caller."""
+        """Given the row at `row_index` of `payload` (`self._payload`, which is `self._encoded` without `LAST_SEEN_INDEX_COLUMN`
+        and possibly has extra rows after it), this method should implement how `__getitem__` hands a value to the caller. Values
+        should be read from `payload` directly instead of copying the row. Last seen indices can be read from `self._last_index_col`."""
 
     def __getitem__(
         self, local_sample_index: int, return_row_index: bool = False
@@ -186,14 +402,21 @@ class Encoder(ABC):
             return_row_index (bool): If True, the index of the row that the value was derived from is returned as well.
                 Defaults to False.
 
+        Raises:
+            IndexError: If `local_sample_index` is out of bounds.
+
         Returns:
             Any: Either just a singular derived value, or a tuple with the derived value and the row index respectively.
         """
 
         row_index = self.translate_index(local_sample_index)
-        value = self._derive_value(
-            self._encoded[row_index], row_index, local_sample_index
-        )
+        if row_index >= self._length:
+            raise IndexError(
+                f"Index {local_sample_index} is out of bounds for an encoding with {self._num_samples} samples."
+            )
+
+        # `self._payload` may have spare rows after `self._length`, but it is not sliced since `row_index` is in bounds
+        value = self._derive_value(self._payload, row_index, local_sample_index)
 
         if return_row_index:
             return value, row_index
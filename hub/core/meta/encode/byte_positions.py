@@ -1,4 +1,4 @@
-from hub.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
+from hub.core.meta.encode.base_encoder import Encoder
 from typing import Sequence
 import numpy as np
 
@@ -11,23 +11,72 @@ class BytePositionsEncoder(Encoder):
     def num_bytes_encoded_under_row(self, row_index: int) -> int:
         """Calculates the amount of bytes total under a specific row. Useful for adding new rows to `_encoded`."""
 
-        if len(self._encoded) == 0:
+        if self._length == 0:
             return 0
 
         if row_index < 0:
-            row_index = len(self._encoded) + row_index
+            row_index = self._length + row_index
 
-        row = self._encoded[row_index]
+        row = self._payload[row_index]
 
         if row_index == 0:
             previous_last_index = -1
         else:
-            previous_last_index = self._encoded[row_index - 1, LAST_SEEN_INDEX_COLUMN]
+            previous_last_index = int(self._last_index_col[row_index - 1])
 
-        num_samples = row[LAST_SEEN_INDEX_COLUMN] - previous_last_index
-        num_bytes_for_entry = num_samples * row[NUM_BYTES_COLUMN]
+        num_samples = int(self._last_index_col[row_index]) - previous_last_index
+        num_bytes_for_entry = num_samples * int(row[NUM_BYTES_COLUMN])
         return int(num_bytes_for_entry + row[START_BYTE_COLUMN])
 
+    def register_samples_bulk(self, items: Sequence[int], counts: Sequence[int]):
+        """Registers `counts[i]` samples that each have `items[i]` bytes for every `i`. Produces the same encoding as calling
+        `register_samples` for each pair in order, but all new rows are computed in one vectorized pass.
+
+        Args:
+            items (Sequence[int]): Number of bytes for each sample of each group.
+            counts (Sequence[int]): Number of samples in each group.
+
+        Raises:
+            ValueError: If any of `items` is negative or any of `counts` is not positive.
+            EncodingOverflowError: If any of the new rows has a value that is too large to be encoded.
+        """
+
+        num_bytes = np.asarray(items, dtype=np.int64)
+        num_samples = np.asarray(counts, dtype=np.int64)
+
+        if len(num_bytes) == 0:
+            return
+
+        if num_bytes.min() < 0:
+            raise ValueError(f"`num_bytes` must be >= 0. Got {num_bytes.min()}.")
+        if num_samples.min() <= 0:
+            raise ValueError(f"`num_samples` should be > 0. Got: {num_samples.min()}")
+
+        # consecutive groups with the same number of bytes are combined into a single row
+        run_starts = np.flatnonzero(
+            np.concatenate(([True], num_bytes[1:] != num_bytes[:-1]))
+        )
+        run_num_bytes = num_bytes[run_starts]
+        run_counts = np.add.reduceat(num_samples, run_starts)
+
+        # the first run may also be combined with the existing last row
+        if self.num_samples != 0 and self._combine_condition(run_num_bytes[0]):
+            self.register_samples(int(run_num_bytes[0]), int(run_counts[0]))
+            run_num_bytes = run_num_bytes[1:]
+            run_counts = run_counts[1:]
+
+            if len(run_counts) == 0:
+                return
+
+        run_sizes = run_num_bytes * run_counts
+        start_bytes = self.num_bytes_encoded_under_row(-1) + np.concatenate(
+            ([0], np.cumsum(run_sizes[:-1]))
+        )
+        last_indices = self.num_samples - 1 + np.cumsum(run_counts)
+
+        rows = np.stack([run_num_bytes, start_bytes, last_indices], axis=1)
+        self._append_rows(rows)
+
     def _validate_incoming_item(self, num_bytes: int, _):
         if num_bytes < 0:
             raise ValueError(f"`num_bytes` must be >= 0. Got {num_bytes}.")
@@ -35,7 +84,7 @@ class BytePositionsEncoder(Encoder):
         super()._validate_incoming_item(num_bytes, _)
 
     def _combine_condition(self, num_bytes: int) -> bool:
-        last_num_bytes = self._encoded[-1, NUM_BYTES_COLUMN]
+        last_num_bytes = self._payload[self._length - 1, NUM_BYTES_COLUMN]
         return num_bytes == last_num_bytes
 
     def _make_decomposable(self, num_bytes: int) -> Sequence:
@@ -43,14 +92,14 @@ class BytePositionsEncoder(Encoder):
         return [num_bytes, sb]
 
     def _derive_value(
-        self, row: np.ndarray, row_index: int, local_sample_index: int
+        self, payload: np.ndarray, row_index: int, local_sample_index: int
     ) -> np.ndarray:
         index_bias = 0
         if row_index >= 1:
-            index_bias = self._encoded[row_index - 1][LAST_SEEN_INDEX_COLUMN] + 1
+            index_bias = self._last_index_col[row_index - 1] + 1
 
-        row_num_bytes = row[NUM_BYTES_COLUMN]
-        row_start_byte = row[START_BYTE_COLUMN]
+        row_num_bytes = payload[row_index, NUM_BYTES_COLUMN]
+        row_start_byte = payload[row_index, START_BYTE_COLUMN]
 
         start_byte = row_start_byte + (local_sample_index - index_bias) * row_num_bytes
         end_byte = start_byte + row_num_bytes
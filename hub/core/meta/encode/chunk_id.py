@@ -1,4 +1,4 @@
-from hub.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
+from hub.core.meta.encode.base_encoder import Encoder, ENCODING_MAX
 from hub.constants import ENCODING_DTYPE, UUID_SHIFT_AMOUNT
 from hub.util.exceptions import ChunkIdEncoderError
 import hub
@@ -32,7 +32,7 @@ class ChunkIdEncoder(Encoder, Cachable):
         """Gets the name for the chunk at index `chunk_index`. If you need to get the name for a chunk from a sample index, instead
         use `__getitem__`, then `name_from_id`."""
 
-        chunk_id = self._encoded[:, CHUNK_ID_COLUMN][chunk_index]
+        chunk_id = self._payload[: self._length, CHUNK_ID_COLUMN][chunk_index]
         return ChunkIdEncoder.name_from_id(chunk_id)
 
     @classmethod
@@ -49,7 +49,7 @@ class ChunkIdEncoder(Encoder, Cachable):
     def num_chunks(self) -> int:
         if self.num_samples == 0:
             return 0
-        return len(self._encoded)
+        return self._length
 
     def generate_chunk_id(self) -> ENCODING_DTYPE:
         """Generates a random 64bit chunk ID using uuid4. Also prepares this ID to have samples registered to it.
@@ -66,12 +66,7 @@ class ChunkIdEncoder(Encoder, Cachable):
 
         else:
             last_index = self.num_samples - 1
-
-            new_entry = np.array(
-                [[id, last_index]],
-                dtype=ENCODING_DTYPE,
-            )
-            self._encoded = np.concatenate([self._encoded, new_entry])
+            self._append_row((id,), last_index)
 
         return id
 
@@ -90,6 +85,16 @@ class ChunkIdEncoder(Encoder, Cachable):
 
         super().register_samples(None, num_samples)
 
+    def register_run(self, num_samples: int):  # type: ignore
+        """Same as `register_samples`, but `num_samples` is not validated. Should be used when the caller knows that a chunk ID
+        was generated and `num_samples` is positive.
+
+        Args:
+            num_samples (int): The number of samples the last chunk ID should have added to it's registration.
+        """
+
+        super().register_run(None, num_samples)
+
     def translate_index_relative_to_chunks(self, global_sample_index: int) -> int:
         """Converts `global_sample_index` into a new index that is relative to the chunk the sample belongs to.
 
@@ -122,8 +127,7 @@ class ChunkIdEncoder(Encoder, Cachable):
         if chunk_index == 0:
             return global_sample_index
 
-        current_entry = self._encoded[chunk_index - 1]  # type: ignore
-        last_num_samples = current_entry[LAST_SEEN_INDEX_COLUMN] + 1
+        last_num_samples = self._last_index_col[chunk_index - 1] + 1
 
         return int(global_sample_index - last_num_samples)
 
@@ -148,13 +152,11 @@ class ChunkIdEncoder(Encoder, Cachable):
     def _combine_condition(self, _) -> bool:
         return True
 
-    def _derive_next_last_index(self, last_index: ENCODING_DTYPE, num_samples: int):
-        # this operation will trigger an overflow for the first addition, so supress the warning
-        np.seterr(over="ignore")
-        new_last_index = last_index + ENCODING_DTYPE(num_samples)
-        np.seterr(over="warn")
-
-        return new_last_index
+    def _derive_next_last_index(self, last_index: int, num_samples: int):
+        # until samples are registered to the first chunk(s), their last seen index is -1 (which is stored as `ENCODING_MAX`)
+        if last_index == ENCODING_MAX:
+            last_index = -1
+        return last_index + num_samples
 
-    def _derive_value(self, row: np.ndarray, *_) -> np.ndarray:
-        return row[CHUNK_ID_COLUMN]
+    def _derive_value(self, payload: np.ndarray, row_index: int, *_) -> np.ndarray:
+        return payload[row_index, CHUNK_ID_COLUMN]
@@ -1,16 +1,64 @@
-from hub.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
+from hub.core.meta.encode.base_encoder import Encoder
 from hub.constants import ENCODING_DTYPE
-from typing import Tuple
+from typing import Sequence, Tuple
 from hub.core.storage.provider import StorageProvider
 import numpy as np
 
 
 class ShapeEncoder(Encoder):
-    def _derive_value(self, row: np.ndarray, *_) -> np.ndarray:
-        return tuple(row[:LAST_SEEN_INDEX_COLUMN])
+    def _derive_value(self, payload: np.ndarray, row_index: int, *_) -> np.ndarray:
+        return tuple(payload[row_index].tolist())
+
+    def register_samples_bulk(self, items: Sequence[Tuple[int]], counts: Sequence[int]):
+        """Registers `counts[i]` samples with the shape `items[i]` for every `i`. Produces the same encoding as calling
+        `register_samples` for each pair in order, but whether each shape combines with the one before it is computed for
+        the whole batch at once, instead of calling `_combine_condition` for every shape.
+
+        Args:
+            items (Sequence[Tuple[int]]): Shape of the samples in each group.
+            counts (Sequence[int]): Number of samples in each group.
+
+        Raises:
+            ValueError: If the shapes don't all have the same length or any of `counts` is not positive.
+        """
+
+        num_samples = np.asarray(counts, dtype=np.int64)
+        num_items = len(num_samples)
+        if num_items == 0:
+            return
+
+        ndim = len(items[0])
+        if any(len(shape) != ndim for shape in items):
+            raise ValueError(
+                "All sample shapes in a tensor must have the same len(shape)."
+            )
+        if num_samples.min() <= 0:
+            raise ValueError(f"`num_samples` should be > 0. Got: {num_samples.min()}")
+
+        shapes = np.array(items, dtype=np.int64).reshape(num_items, ndim)
+        first_shape = tuple(shapes[0].tolist())
+        self._validate_incoming_item(first_shape, int(num_samples[0]))
+
+        # consecutive groups with the same shape are combined into a single row
+        combines_with_previous = (shapes[1:] == shapes[:-1]).all(axis=1)
+        run_starts = np.flatnonzero(np.concatenate(([True], ~combines_with_previous)))
+        run_shapes = shapes[run_starts]
+        run_counts = np.add.reduceat(num_samples, run_starts)
+
+        # the first run may also be combined with the existing last row
+        if self.num_samples != 0 and self._combine_condition(first_shape):
+            self.register_run(first_shape, int(run_counts[0]))
+            run_shapes = run_shapes[1:]
+            run_counts = run_counts[1:]
+
+            if len(run_counts) == 0:
+                return
+
+        last_indices = self.num_samples - 1 + np.cumsum(run_counts)
+        self._append_rows(np.column_stack((run_shapes, last_indices)))
 
     def _validate_incoming_item(self, shape: Tuple[int], _):
-        if len(self._encoded) > 0:
+        if self._length > 0:
             last_shape = self[-1]  # TODO: optimize this
 
             if len(shape) != len(last_shape):
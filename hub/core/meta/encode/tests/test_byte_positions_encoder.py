@@ -1,6 +1,8 @@
 import numpy as np
 import pytest
+from hub.core.meta.encode.base_encoder import ENCODING_MAX
 from hub.core.meta.encode.byte_positions import BytePositionsEncoder
+from hub.util.exceptions import EncodingOverflowError
 
 
 def test_trivial():
@@ -65,3 +67,53 @@ def test_failures():
     with pytest.raises(ValueError):
         # num_samples cannot be 0
         enc.register_samples(8, 0)
+
+
+def test_overflow():
+    enc = BytePositionsEncoder()
+
+    with pytest.raises(EncodingOverflowError):
+        enc.register_samples(ENCODING_MAX + 1, 1)
+    assert enc.num_samples == 0
+
+    enc.register_samples(0, ENCODING_MAX)
+    enc.register_samples(4, 1)
+    assert enc.num_samples == ENCODING_MAX + 1
+
+    # the next last seen index doesn't fit
+    with pytest.raises(EncodingOverflowError):
+        enc.register_samples(4, 1)
+    with pytest.raises(EncodingOverflowError):
+        enc.register_samples(1, 1)
+    with pytest.raises(EncodingOverflowError):
+        enc.register_samples_bulk([1, 2], [1, 1])
+
+    # failed writes leave the encoding unchanged
+    assert enc.num_samples == ENCODING_MAX + 1
+    assert len(enc._encoded) == 2
+    assert enc[ENCODING_MAX] == (0, 4)
+
+
+def test_register_samples_bulk():
+    num_bytes = [8, 8, 1, 4, 4, 4, 0, 8]
+    counts = [10, 5, 1, 2, 2, 1, 3, 1]
+
+    expected = BytePositionsEncoder()
+    expected.register_samples(8, 3)
+    for item, num_samples in zip(num_bytes, counts):
+        expected.register_samples(item, num_samples)
+
+    enc = BytePositionsEncoder()
+    enc.register_samples(8, 3)
+    enc.register_samples_bulk(num_bytes, counts)
+
+    np.testing.assert_array_equal(enc._encoded, expected._encoded)
+    assert enc.num_samples == expected.num_samples
+    assert enc.nbytes == expected.array.nbytes
+    for i in range(enc.num_samples):
+        assert enc[i] == expected[i]
+
+    with pytest.raises(ValueError):
+        enc.register_samples_bulk([1, -1], [1, 1])
+    with pytest.raises(ValueError):
+        enc.register_samples_bulk([1, 1], [1, 0])
@@ -89,3 +89,30 @@ def test_ids():
     out_id = ChunkIdEncoder.id_from_name(name)
 
     assert id == out_id
+
+
+def test_num_samples_after_deserialization():
+    enc = ChunkIdEncoder()
+    enc.generate_chunk_id()
+    enc.register_samples(10)
+    enc.generate_chunk_id()
+    enc.register_samples(5)
+
+    deserialized = ChunkIdEncoder.frombuffer(bytes(enc.tobytes()))
+    assert deserialized.num_samples == 15
+    assert deserialized.num_chunks == 2
+
+    deserialized.register_samples(3)
+    assert deserialized.num_samples == 18
+    assert deserialized.translate_index_relative_to_chunks(17) == 7
+
+
+def test_encoded_is_read_only():
+    enc = ChunkIdEncoder()
+    enc.generate_chunk_id()
+    enc.register_samples(10)
+
+    with pytest.raises(ValueError):
+        enc.array[0, 1] = 5
+
+    assert enc.num_samples == 10
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from hub.core.meta.encode import base_encoder
 from hub.core.meta.encode.shape import ShapeEncoder
 
 
@@ -128,3 +129,102 @@ def test_failures():
     assert len(enc._encoded) == 1
 
     assert enc[-1] == (100, 100)
+
+
+def test_register_run():
+    enc = ShapeEncoder()
+
+    with pytest.raises(ValueError):
+        enc.register_run((28, 28), 1)
+
+    enc.register_samples((28, 28), 1)
+    enc.register_run((28, 28), 1)
+    enc.register_run((28, 28), 10)
+
+    expected = ShapeEncoder()
+    expected.register_samples((28, 28), 12)
+
+    np.testing.assert_array_equal(enc._encoded, expected._encoded)
+    assert enc.num_samples == 12
+    assert enc[11] == (28, 28)
+
+
+@pytest.mark.parametrize(
+    "shapes",
+    [
+        [(28, 28), (28, 28), (10, 28), (28, 28), (28, 28), (0, 0), (0, 0)],
+        [(), (), ()],
+    ],
+)
+def test_register_samples_bulk(shapes):
+    counts = list(range(1, len(shapes) + 1))
+
+    expected = ShapeEncoder()
+    expected.register_samples(shapes[0], 3)
+    for shape, num_samples in zip(shapes, counts):
+        expected.register_samples(shape, num_samples)
+
+    enc = ShapeEncoder()
+    enc.register_samples(shapes[0], 3)
+    enc.register_samples_bulk(shapes, counts)
+
+    np.testing.assert_array_equal(enc._encoded, expected._encoded)
+    assert enc.num_samples == expected.num_samples
+    for i in range(enc.num_samples):
+        assert enc[i] == expected[i]
+
+    with pytest.raises(ValueError):
+        enc.register_samples_bulk([(1, 2), (1,)], [1, 1])
+    with pytest.raises(ValueError):
+        enc.register_samples_bulk([(1, 2, 3)], [1])
+    with pytest.raises(ValueError):
+        enc.register_samples_bulk([(1, 2)], [0])
+    assert enc.num_samples == expected.num_samples
+
+
+def test_many_rows():
+    enc = ShapeEncoder()
+
+    for i in range(100):
+        enc.register_samples((i, 2), 2)
+
+    assert len(enc._encoded) == 100
+    assert enc.array.shape == (100, 3)
+    assert enc.nbytes == enc.array.nbytes
+    assert enc.num_samples == 200
+    assert enc[0] == (0, 2)
+    assert enc[101] == (50, 2)
+    assert enc[-1] == (99, 2)
+
+    # only the registered rows are serialized
+    deserialized = ShapeEncoder(enc.array.copy())
+    np.testing.assert_array_equal(deserialized.array, enc.array)
+    assert deserialized.num_samples == 200
+
+
+def _check_lookups():
+    enc = ShapeEncoder()
+    expected = []
+    for i in range(1, 20):
+        enc.register_samples((i,), i)
+        expected.extend([(i,)] * i)
+
+    # sequential, reversed and random lookups all go through the row hint
+    indices = [*range(len(expected)), *reversed(range(len(expected)))]
+    indices.extend(np.random.randint(0, len(expected), 100))
+    for i in indices:
+        assert enc[i] == expected[i]
+
+    with pytest.raises(IndexError):
+        enc[len(expected)]
+
+
+def test_lookup_order():
+    _check_lookups()
+
+
+@pytest.mark.parametrize("bisect_max_rows", [0, 4096])
+def test_lookup_without_numba(monkeypatch, bisect_max_rows):
+    monkeypatch.setattr(base_encoder, "numba_installed", False)
+    monkeypatch.setattr(base_encoder, "BISECT_MAX_ROWS", bisect_max_rows)
+    _check_lookups()
@@ -79,9 +79,9 @@ class TensorMeta(Meta):
         dtype = np.dtype(dtype)
         if self.dtype and self.dtype != dtype.name:
             if np.can_cast(dtype, self.dtype):
-                buffer = memoryview(
-                    np.cast[self.dtype](np.frombuffer(buffer, dtype=dtype)).tobytes()
-                )
+                # `astype` makes the only copy, the result is viewed as bytes
+                array = np.frombuffer(buffer, dtype=dtype).astype(self.dtype)
+                buffer = memoryview(array.view(np.uint8))
             else:
                 raise TensorDtypeMismatchError(
                     self.dtype,
@@ -248,6 +248,22 @@ def _validate_required_htype_overwrites(htype_overwrite: dict):
             "Datatype must be supported by numpy. Can be an `str`, `np.dtype`, or normal python type (like `bool`, `float`, `int`, etc.). List of available numpy dtypes found here: https://numpy.org/doc/stable/user/basics.types.html",
         )
 
+    if htype_overwrite.get("compression_quality") is not None:
+        _raise_if_condition(
+            "compression_quality",
+            htype_overwrite,
+            lambda quality: not isinstance(quality, int) or not 1 <= quality <= 100,
+            "Compression quality must be an integer between 1 and 100.",
+        )
+
+    if htype_overwrite.get("max_side") is not None:
+        _raise_if_condition(
+            "max_side",
+            htype_overwrite,
+            lambda max_side: not isinstance(max_side, int) or max_side <= 0,
+            "Max side must be a positive integer.",
+        )
+
 
 def _format_values(htype_overwrite: dict):
     """Replaces values in `htype_overwrite` with consistent types/formats."""
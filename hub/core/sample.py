@@ -1,12 +1,33 @@
 # type: ignore
-from hub.core.compression import compress_array
+from hub.core.compression import compress_array, compress_multiple
 import numpy as np
 import pathlib
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from PIL import Image  # type: ignore
 
 
+# number of channels (None for 2D arrays) and dtype of the array `np.array` returns for a PIL image, by the image's mode.
+# used for reading a sample's shape and dtype from its file's header, without decoding it
+_PIL_MODE_ARRAY_LAYOUTS: Dict[str, Tuple[Optional[int], str]] = {
+    "1": (None, "bool"),
+    "L": (None, "uint8"),
+    "P": (None, "uint8"),
+    "I": (None, "int32"),
+    "F": (None, "float32"),
+    "I;16": (None, "uint16"),
+    "LA": (2, "uint8"),
+    "PA": (2, "uint8"),
+    "RGB": (3, "uint8"),
+    "YCbCr": (3, "uint8"),
+    "LAB": (3, "uint8"),
+    "HSV": (3, "uint8"),
+    "RGBA": (4, "uint8"),
+    "RGBX": (4, "uint8"),
+    "CMYK": (4, "uint8"),
+}
+
+
 class Sample:
     path: Optional[pathlib.Path]
 
@@ -19,7 +40,8 @@ class Sample:
 
         Note:
             If `self.is_lazy` is True, this `Sample` doesn't actually have have any data loaded. To read this data,
-                simply try to read one of it's properties (such as `self.array`, `self.shape`, etc.).
+                simply read `self.array`. `self.shape`, `self.dtype` and `self.compression` are read from the file's
+                header, so they don't load the data.
 
         Args:
             path (str): Path to a sample stored on the local file system that represents a single sample. If `path` is provided, `array` should not be.
@@ -37,12 +59,20 @@ class Sample:
             self.path = pathlib.Path(path)
             self._array = None
 
+            # read from the file's header by `_read_meta`, see `shape` and `dtype`
+            self._shape: Optional[Tuple[int, ...]] = None
+            self._dtype: Optional[str] = None
+            self._original_compression = None
+
         if array is not None:
             self.path = None
             self._array = array
             self._original_compression = None
 
-        self._compressed_bytes = None
+        # compressed bytes are cached for every `(compression, quality)` they were requested with
+        self._compressed_bytes: Dict[
+            Tuple[str, Optional[int]], Union[bytes, memoryview]
+        ] = {}
         self._uncompressed_bytes = None
 
     @property
@@ -51,8 +81,7 @@ class Sample:
 
     @property
     def is_empty(self) -> bool:
-        self._read()
-        return 0 in self.array.shape
+        return 0 in self.shape
 
     @property
     def array(self) -> np.ndarray:
@@ -61,60 +90,116 @@ class Sample:
 
     @property
     def shape(self) -> Tuple[int, ...]:
-        self._read()
-        return self._array.shape  # type: ignore
+        """Shape of `self.array`. If this sample is lazy, it is read from the file's header without decoding the file."""
+
+        if self._array is None:
+            self._read_meta()
+            if self._shape is not None:
+                return self._shape
+        return self.array.shape  # type: ignore
 
     @property
     def dtype(self) -> str:
-        self._read()
-        return self._array.dtype.name  # type: ignore
+        """Dtype of `self.array`. If this sample is lazy, it is read from the file's header without decoding the file."""
+
+        if self._array is None:
+            self._read_meta()
+            if self._dtype is not None:
+                return self._dtype
+        return self.array.dtype.name  # type: ignore
 
     @property
     def compression(self) -> str:
-        self._read()
+        if self._array is None:
+            self._read_meta()
 
         if self.is_empty:
             return None
 
         return self._original_compression.lower()
 
-    def compressed_bytes(self, compression: str) -> bytes:
+    def compressed_bytes(
+        self, compression: str, quality: Optional[int] = None
+    ) -> Union[bytes, memoryview]:
         """Returns this sample as compressed bytes.
 
         Note:
             If this sample is pointing to a path and the requested `compression` is the same as it's stored in, the data is
-                returned without re-compressing.
+                returned without re-compressing (unless a `quality` is requested).
+            The result is cached per `(compression, quality)`, so requesting the same bytes again doesn't re-compress.
 
         Args:
             compression (str): `self.array` will be compressed into this format. If `compression is None`, return `self.uncompressed_bytes()`.
+            quality (int, optional): Quality for lossy compressions. See `compress_array`. Defaults to None.
 
         Returns:
-            bytes: Bytes for the compressed sample. Contains all metadata required to decompress within these bytes.
+            Union[bytes, memoryview]: Bytes for the compressed sample. Contains all metadata required to decompress within these bytes.
         """
         if compression is None:
             return self.uncompressed_bytes()
 
-        if self._compressed_bytes is None:
+        cache_key = (compression, quality)
+        compressed_bytes = self._compressed_bytes.get(cache_key)
+
+        if compressed_bytes is None:
 
             # if the sample is already compressed in the requested format, just return the raw bytes
-            if self.path is not None and self.compression == compression:
+            if self._can_reuse_file(compression, quality):
 
                 with open(self.path, "rb") as f:
-                    self._compressed_bytes = f.read()
+                    compressed_bytes = f.read()
 
             else:
-                self._compressed_bytes = compress_array(self.array, compression)
+                compressed_bytes = compress_array(self.array, compression, quality)
+
+            self._compressed_bytes[cache_key] = compressed_bytes
 
-        return self._compressed_bytes
+        return compressed_bytes
 
-    def uncompressed_bytes(self) -> bytes:
-        """Returns `self.array` as uncompressed bytes."""
+    def _can_reuse_file(self, compression: str, quality: Optional[int]) -> bool:
+        """Returns True if this sample is pointing to a file that is already compressed the way it is requested."""
+
+        return (
+            self.path is not None
+            and quality is None
+            and self.compression == compression
+        )
+
+    def uncompressed_bytes(self) -> memoryview:
+        """Returns `self.array` as uncompressed bytes.
+
+        Note:
+            If `self.array` is C-contiguous, the result is a view over it instead of a copy.
+        """
 
         if self._uncompressed_bytes is None:
-            self._uncompressed_bytes = self.array.tobytes()
+            # note: `memoryview.cast` does not support arrays with 0 in their shape, so the array is viewed as bytes instead
+            flat = np.ascontiguousarray(self.array).reshape(-1).view(np.uint8)
+            self._uncompressed_bytes = memoryview(flat)
 
         return self._uncompressed_bytes
 
+    def _read_meta(self):
+        """If this sample is lazy, reads the compression, shape and dtype of the file it points to from the file's header.
+        The file is only decoded (see `_read`) if the array layout for its image mode is not known."""
+
+        if self._shape is not None or self._array is not None:
+            return
+
+        with Image.open(self.path) as img:
+            self._original_compression = img.format.lower()
+            layout = _PIL_MODE_ARRAY_LAYOUTS.get(img.mode)
+
+            if layout is not None:
+                channels, dtype = layout
+                shape: Tuple[int, ...] = (img.height, img.width)
+                if channels is not None:
+                    shape += (channels,)
+                self._shape, self._dtype = shape, dtype
+
+        if layout is None:
+            self._read()
+
     def _read(self):
         """If this sample hasn't been already read into memory, do so. This is required for properties to be accessible."""
 
@@ -138,3 +223,39 @@ class Sample:
 
     def __repr__(self):
         return str(self)
+
+
+def compressed_bytes_multiple(
+    samples: Sequence[Sample], compression: str, quality: Optional[int] = None
+) -> List[Union[bytes, memoryview]]:
+    """Returns `Sample.compressed_bytes` for each of `samples`.
+
+    Note:
+        All samples that have to be (re-)compressed are compressed in a single `compress_multiple` batch instead of one
+            by one. The results are cached in the samples the same way `Sample.compressed_bytes` caches them.
+
+    Args:
+        samples (Sequence[Sample]): Samples to compress.
+        compression (str): Compression to use. See `Sample.compressed_bytes`.
+        quality (int, optional): Quality for lossy compressions. See `compress_array`. Defaults to None.
+
+    Returns:
+        List[Union[bytes, memoryview]]: Bytes for each compressed sample, in the same order as `samples`.
+    """
+
+    if compression is not None:
+        cache_key = (compression, quality)
+        pending = [
+            sample
+            for sample in samples
+            if cache_key not in sample._compressed_bytes
+            and not sample._can_reuse_file(compression, quality)
+        ]
+
+        arrays = [sample.array for sample in pending]
+        for sample, buffer in zip(
+            pending, compress_multiple(arrays, compression, quality)
+        ):
+            sample._compressed_bytes[cache_key] = buffer
+
+    return [sample.compressed_bytes(compression, quality) for sample in samples]
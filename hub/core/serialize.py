@@ -15,8 +15,10 @@ def infer_chunk_num_bytes(
 
     Args:
         version: (str) Version of hub library
-        shape_info: (numpy.ndarray) Encoded shapes info from the chunk's `ShapeEncoder` instance.
-        byte_positions: (numpy.ndarray) Encoded byte positions from the chunk's `BytePositionsEncoder` instance.
+        shape_info: (numpy.ndarray) Encoded shapes info from the chunk's `ShapeEncoder` instance. Only `nbytes` is read,
+            so the encoder itself can be passed instead of assembling its array.
+        byte_positions: (numpy.ndarray) Encoded byte positions from the chunk's `BytePositionsEncoder` instance. Only `nbytes` is read,
+            so the encoder itself can be passed instead of assembling its array.
         data: (list) `_data` field of the chunk
         len_data: (int, optional) Number of bytes in the chunk
 
@@ -50,64 +52,104 @@ def serialize_chunk(
         Serialized chunk as memoryview.
     """
     nbytes = infer_chunk_num_bytes(version, shape_info, byte_positions, data, len_data)
-    flatbuff = np.zeros(nbytes, dtype=np.byte)
+
+    # headers and data are written directly into the output buffer (no intermediate copies of the data are made)
+    flatbuff = bytearray(nbytes)
 
     # Write version
     len_version = len(version)
     flatbuff[0] = len_version
-    flatbuff[1 : 1 + len_version] = list(map(ord, version))
+    flatbuff[1 : 1 + len_version] = version.encode("ascii")
     offset = 1 + len_version
 
     # Write shape info
     if shape_info.ndim == 1:
-        flatbuff[offset : offset + 8] = np.zeros(8, dtype=np.byte)
+        # buffer is zero initialized
         offset += 8
     else:
-        flatbuff[offset : offset + 8] = np.array(shape_info.shape, dtype=np.int32).view(
-            np.byte
+        flatbuff[offset : offset + 8] = _as_byte_view(
+            np.array(shape_info.shape, dtype=np.int32)
         )
         offset += 8
-        flatbuff[offset : offset + shape_info.nbytes] = shape_info.reshape(-1).view(
-            np.byte
-        )
+        flatbuff[offset : offset + shape_info.nbytes] = _as_byte_view(shape_info)
         offset += shape_info.nbytes
 
     # Write byte positions
     if byte_positions.ndim == 1:
-        flatbuff[offset : offset + 4] = np.zeros(4, dtype=np.byte)
+        # buffer is zero initialized
         offset += 4
     else:
-        flatbuff[offset : offset + 4] = np.int32(byte_positions.shape[0]).view(
-            (np.byte, 4)
+        flatbuff[offset : offset + 4] = _as_byte_view(
+            np.array(byte_positions.shape[0], dtype=np.int32)
         )
         offset += 4
-        flatbuff[offset : offset + byte_positions.nbytes] = byte_positions.reshape(
-            -1
-        ).view(np.byte)
+        flatbuff[offset : offset + byte_positions.nbytes] = _as_byte_view(
+            byte_positions
+        )
         offset += byte_positions.nbytes
 
     # Write actual data
     for byts in data:
-        n = len(byts)
-        flatbuff[offset : offset + n] = np.frombuffer(byts, dtype=np.byte)
+        byts = memoryview(byts)
+        n = byts.nbytes
+        flatbuff[offset : offset + n] = byts
         offset += n
-    return memoryview(flatbuff.tobytes())
+    return memoryview(flatbuff)
 
 
-def deserialize_chunk(
+def _as_byte_view(array: np.ndarray) -> memoryview:
+    """Returns a flat, unsigned byte `memoryview` of `array`. Only copies if `array` is not C-contiguous."""
+
+    return memoryview(np.ascontiguousarray(array)).cast("B")
+
+
+def infer_chunk_header_num_bytes(byts: Union[bytes, memoryview]) -> int:
+    """Calculates the number of bytes of a serialized chunk's header, given a prefix of the serialized chunk.
+    Used for reading a chunk's header without reading its data.
+
+    Note:
+        If `byts` is too short to tell, a lower bound is returned instead (which is always larger than `len(byts)`).
+            Calling this again with a prefix of at least that many bytes eventually returns the exact value.
+
+    Args:
+        byts: (bytes) Prefix of a serialized chunk.
+
+    Returns:
+        Number of bytes of the header (or a lower bound) as int.
+    """
+    enc_dtype = np.dtype(hub.constants.ENCODING_DTYPE)
+
+    buff = np.frombuffer(byts, dtype=np.byte)
+
+    if len(buff) < 1:
+        return 1
+    offset = 1 + int(buff[0])
+
+    if len(buff) < offset + 8:
+        return offset + 8
+    shape_info_shape = buff[offset : offset + 8].view(np.int32)
+    offset += 8 + int(np.prod(shape_info_shape)) * enc_dtype.itemsize
+
+    if len(buff) < offset + 4:
+        return offset + 4
+    byte_positions_rows = int(buff[offset : offset + 4].view(np.int32)[0])
+    return offset + 4 + byte_positions_rows * 3 * enc_dtype.itemsize
+
+
+def deserialize_chunk_header(
     byts: Union[bytes, memoryview]
-) -> Tuple[str, np.ndarray, np.ndarray, memoryview]:
-    """Deserializes a chunk from the serialized byte stream. This is how the chunk can be accessed/modified after it is read from storage.
+) -> Tuple[str, np.ndarray, np.ndarray, int]:
+    """Deserializes a chunk's header from the serialized byte stream. `byts` does not need to contain the chunk's data.
 
     Args:
-        byts: (bytes) Serialized chunk.
+        byts: (bytes) Serialized chunk, or a prefix of it that contains at least the header.
 
     Returns:
         Tuple of:
         hub version used to create the chunk,
         encoded shapes info as numpy array,
         encoded byte positions as numpy array,
-        chunk data as memoryview.
+        offset of the chunk data in the serialized chunk.
     """
     enc_dtype = np.dtype(hub.constants.ENCODING_DTYPE)
 
@@ -148,7 +190,28 @@ def deserialize_chunk(
         )
         offset += byte_positions_nbytes
 
+    return version, shape_info, byte_positions, int(offset)
+
+
+def deserialize_chunk(
+    byts: Union[bytes, memoryview]
+) -> Tuple[str, np.ndarray, np.ndarray, memoryview]:
+    """Deserializes a chunk from the serialized byte stream. This is how the chunk can be accessed/modified after it is read from storage.
+
+    Args:
+        byts: (bytes) Serialized chunk.
+
+    Returns:
+        Tuple of:
+        hub version used to create the chunk,
+        encoded shapes info as numpy array,
+        encoded byte positions as numpy array,
+        chunk data as memoryview.
+    """
+    version, shape_info, byte_positions, offset = deserialize_chunk_header(byts)
+
     # Read data
+    buff = np.frombuffer(byts, dtype=np.byte)
     data = memoryview(buff[offset:].tobytes())
 
     return version, shape_info, byte_positions, data
@@ -1,6 +1,6 @@
 from abc import ABC
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from hub.util.exceptions import CallbackInitializationError
 
 
@@ -29,6 +29,14 @@ class Cachable(ABC):
     def tobytes(self) -> bytes:
         return bytes(json.dumps(self.__getstate__()), "utf-8")
 
+    def get_bytes(
+        self, start_byte: Optional[int] = None, end_byte: Optional[int] = None
+    ) -> Optional[memoryview]:
+        """Returns `self.tobytes()[start_byte:end_byte]` if a subclass can read the range without calling `tobytes`,
+        otherwise returns None. Used by `LRUCache.get_bytes`."""
+
+        return None
+
     @classmethod
     def frombuffer(cls, buffer: bytes):
         instance = cls()
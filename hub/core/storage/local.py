@@ -1,7 +1,9 @@
 import os
 import shutil
+from typing import Optional
 
 from hub.core.storage.provider import StorageProvider
+from hub.util.assert_byte_indexes import assert_byte_indexes
 from hub.util.exceptions import DirectoryAtPathException, FileAtPathException
 
 
@@ -53,6 +55,44 @@ class LocalProvider(StorageProvider):
         except Exception:
             raise
 
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Gets the object present at the path within the given byte range. Only the requested bytes are read from the file.
+
+        Example:
+            local_provider = LocalProvider("/home/ubuntu/Documents/")
+            my_data = local_provider.get_bytes("abc.txt", 2, 4)
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            start_byte (int, optional): If only specific bytes starting from start_byte are required.
+            end_byte (int, optional): If only specific bytes up to end_byte are required.
+
+        Returns:
+            bytes: The bytes of the object present at the path within the given byte range.
+
+        Raises:
+            InvalidBytesRequestedError: If `start_byte` > `end_byte` or `start_byte` < 0 or `end_byte` < 0.
+            KeyError: If an object is not found at the path.
+            DirectoryAtPathException: If a directory is found at the path.
+        """
+        assert_byte_indexes(start_byte, end_byte)
+        try:
+            full_path = self._check_is_file(path)
+            with open(full_path, "rb") as file:
+                file.seek(start_byte or 0)
+                if end_byte is None:
+                    return file.read()
+                return file.read(end_byte - (start_byte or 0))
+        except DirectoryAtPathException:
+            raise
+        except FileNotFoundError:
+            raise KeyError
+
     def __setitem__(self, path: str, value: bytes):
         """Sets the object present at the path with the value
 
@@ -1,8 +1,9 @@
 from collections import OrderedDict
 from hub.core.storage.cachable import Cachable, CachableCallback
-from typing import Any, Dict, Set, Union
+from typing import Any, Dict, Optional, Set, Union
 
 from hub.core.storage.provider import StorageProvider
+from hub.util.assert_byte_indexes import assert_byte_indexes
 
 
 def _get_nbytes(obj: Union[bytes, memoryview, Cachable]):
@@ -41,6 +42,9 @@ class LRUCache(StorageProvider):
         # tracks keys in lru order, stores size of value, only keys present in this exist in cache
         self.lru_sizes: OrderedDict[str, int] = OrderedDict()
         self.dirty_keys: Set[str] = set()  # keys present in cache but not next_storage
+        self.partially_read_keys: Set[
+            str
+        ] = set()  # keys read with `get_bytes` without being cached
         self.cache_used = 0
 
     def update_used_cache_for_path(self, path: str, new_size: int):
@@ -122,6 +126,47 @@ class LRUCache(StorageProvider):
                 self._insert_in_cache(path, result)
             return result
 
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Gets the object present at the path within the given byte range.
+        If the item isn't in cache_storage, only the range is retrieved from next storage and nothing is inserted into the cache.
+        The path is then added to `partially_read_keys`, so callers can choose to read and cache it as a whole next time.
+        A cached `Cachable` is only serialized if it can't read the range itself (see `Cachable.get_bytes`) and it is dirty,
+        clean ones are read from next storage instead.
+
+        Args:
+            path (str): The path relative to the root of the underlying storage.
+            start_byte (int, optional): If only specific bytes starting from start_byte are required.
+            end_byte (int, optional): If only specific bytes up to end_byte are required.
+
+        Raises:
+            InvalidBytesRequestedError: If `start_byte` > `end_byte` or `start_byte` < 0 or `end_byte` < 0.
+            KeyError: if an object is not found at the path.
+
+        Returns:
+            bytes: The bytes of the object present at the path within the given byte range.
+        """
+        if path in self.lru_sizes:
+            assert_byte_indexes(start_byte, end_byte)
+            self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            item = self.cache_storage[path]
+            if isinstance(item, Cachable):
+                result = item.get_bytes(start_byte, end_byte)
+                if result is not None:
+                    return result
+                if path not in self.dirty_keys:
+                    return self.next_storage.get_bytes(path, start_byte, end_byte)
+                item = item.tobytes()
+            return item[start_byte:end_byte]
+
+        result = self.next_storage.get_bytes(path, start_byte, end_byte)
+        self.partially_read_keys.add(path)
+        return result
+
     def __setitem__(self, path: str, value: Union[bytes, Cachable]):
         """Puts the item in the cache_storage (if possible), else writes to next_storage.
 
@@ -180,6 +225,7 @@ class LRUCache(StorageProvider):
         self.cache_used = 0
         self.lru_sizes.clear()
         self.dirty_keys.clear()
+        self.partially_read_keys.clear()
         self.cache_storage.clear()
 
         if hasattr(self.next_storage, "clear_cache"):
@@ -193,6 +239,7 @@ class LRUCache(StorageProvider):
         self.cache_used = 0
         self.lru_sizes.clear()
         self.dirty_keys.clear()
+        self.partially_read_keys.clear()
         self.cache_storage.clear()
         self.next_storage.clear()
 
@@ -268,6 +315,7 @@ class LRUCache(StorageProvider):
 
         self._free_up_space(_get_nbytes(value))
         self.cache_storage[path] = value  # type: ignore
+        self.partially_read_keys.discard(path)
 
         self.update_used_cache_for_path(path, _get_nbytes(value))
 
@@ -317,4 +365,5 @@ class LRUCache(StorageProvider):
         self.cache_size = state["cache_size"]
         self.lru_sizes = OrderedDict()
         self.dirty_keys = set()
+        self.partially_read_keys = set()
         self.cache_used = 0
@@ -6,6 +6,7 @@ from typing import Optional
 from botocore.session import ComponentLocator
 from hub.client.client import HubBackendClient
 from hub.core.storage.provider import StorageProvider
+from hub.util.assert_byte_indexes import assert_byte_indexes
 from hub.util.exceptions import S3DeletionError, S3GetError, S3ListError, S3SetError
 import hub
 
@@ -112,6 +113,52 @@ class S3Provider(StorageProvider):
         except Exception as err:
             raise S3GetError(err)
 
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Gets the object present at the path within the given byte range. Uses a ranged GET, so only the requested bytes are downloaded.
+
+        Args:
+            path (str): The path relative to the root of the S3Provider.
+            start_byte (int, optional): If only specific bytes starting from start_byte are required.
+            end_byte (int, optional): If only specific bytes up to end_byte are required.
+
+        Returns:
+            bytes: The bytes of the object present at the path within the given byte range.
+
+        Raises:
+            InvalidBytesRequestedError: If `start_byte` > `end_byte` or `start_byte` < 0 or `end_byte` < 0.
+            KeyError: If an object is not found at the path.
+            S3GetError: Any other error other than KeyError while retrieving the object.
+        """
+        assert_byte_indexes(start_byte, end_byte)
+        start_byte = start_byte or 0
+        if end_byte is not None and end_byte == start_byte:
+            # http ranges are inclusive, an empty range can't be requested
+            return b""
+
+        # note: the end of an http range is inclusive
+        end = "" if end_byte is None else str(end_byte - 1)
+
+        self._check_update_creds()
+        try:
+            path = posixpath.join(self.path, path)
+            resp = self.client.get_object(
+                Bucket=self.bucket,
+                Key=path,
+                Range=f"bytes={start_byte}-{end}",
+            )
+            return resp["Body"].read()
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "NoSuchKey":
+                raise KeyError(err)
+            raise S3GetError(err)
+        except Exception as err:
+            raise S3GetError(err)
+
     def __delitem__(self, path):
         """Delete the object present at the path.
 
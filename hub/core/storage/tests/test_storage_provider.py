@@ -16,6 +16,8 @@ def check_storage_provider(storage):
     storage[FILE_1] = b"hello world"
     assert storage[FILE_1] == b"hello world"
     assert storage.get_bytes(FILE_1, 2, 5) == b"llo"
+    assert storage.get_bytes(FILE_1, 6) == b"world"
+    assert storage.get_bytes(FILE_1, 3, 3) == b""
 
     storage.set_bytes(FILE_1, b"abcde", 6)
     assert storage[FILE_1] == b"hello abcde"
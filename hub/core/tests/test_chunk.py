@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+from hub.core.chunk import Chunk
+from hub.util.exceptions import FullChunkError
+from hub.constants import CHUNK_HEADER_PREFETCH_SIZE, MB
+from hub.core.storage import LRUCache, MemoryProvider
+
+
+def test_uniform_array():
+    chunk = Chunk()
+    a = np.arange(20, dtype="int32").reshape(2, 10)
+
+    for sample in a:
+        chunk.append_sample(memoryview(sample.tobytes()), 1 * MB, sample.shape)
+
+    np.testing.assert_array_equal(chunk.uniform_array("int32"), a)
+
+    # samples with different shapes can't be read as a single array
+    chunk.append_sample(memoryview(a[0, :5].tobytes()), 1 * MB, (5,))
+    assert chunk.uniform_array("int32") is None
+
+
+def test_append_samples():
+    chunk = Chunk()
+    a = np.arange(30, dtype="uint8").reshape(3, 10)
+
+    chunk.append_samples(memoryview(a.tobytes()), 1 * MB, (10,), 3)
+
+    assert chunk.num_data_bytes == 30
+    assert len(chunk.shapes_encoder.array) == 1
+    assert len(chunk.byte_positions_encoder.array) == 1
+    assert chunk.byte_positions_encoder[2] == (20, 30)
+    np.testing.assert_array_equal(chunk.uniform_array("uint8"), a)
+
+    with pytest.raises(ValueError):
+        chunk.append_samples(memoryview(b"\0" * 10), 1 * MB, (10,), 3)
+    assert chunk.num_data_bytes == 30
+
+
+def test_append_with_exported_view():
+    chunk = Chunk()
+    a = np.ones(10, dtype="uint8")
+
+    chunk.append_sample(memoryview(a.tobytes()), 1 * MB, a.shape)
+    view = chunk.uniform_array("uint8")
+
+    # growing the chunk must not invalidate (or be blocked by) views that were already handed out
+    for _ in range(100):
+        chunk.append_sample(memoryview(a.tobytes()), 1 * MB, a.shape)
+
+    np.testing.assert_array_equal(view, [a])
+    assert chunk.num_data_bytes == 1010
+    assert len(chunk.memoryview_data) == 1010
+    assert bytes(Chunk.frombuffer(chunk.tobytes()).memoryview_data) == a.tobytes() * 101
+
+
+def test_read_samples_bytes():
+    chunk = Chunk()
+    samples = [np.arange(i, dtype="int32") for i in range(CHUNK_HEADER_PREFETCH_SIZE)]
+
+    # every sample has a different shape, so the header is larger than a single prefetch
+    for sample in samples:
+        chunk.append_sample(memoryview(sample.tobytes()), 100 * MB, sample.shape)
+
+    storage = MemoryProvider()
+    storage["chunk"] = bytes(chunk.tobytes())
+
+    indices = [0, 7, len(samples) - 1]
+    for i, (buffer, shape) in zip(
+        indices, Chunk.read_samples_bytes(storage, "chunk", indices)
+    ):
+        assert tuple(shape) == samples[i].shape
+        np.testing.assert_array_equal(np.frombuffer(buffer, dtype="int32"), samples[i])
+
+    # the header is larger than what is stored
+    storage["truncated"] = bytes(chunk.tobytes())[: 2 * CHUNK_HEADER_PREFETCH_SIZE]
+    with pytest.raises(ValueError):
+        Chunk.read_samples_bytes(storage, "truncated", indices)
+
+
+def test_append_samples_multiple():
+    chunk = Chunk()
+    buffers = [memoryview(bytes([i]) * i) for i in range(5)]
+
+    chunk.append_sample(buffers[0], 1 * MB, (0,))
+    chunk.append_samples_multiple(buffers[1:], 1 * MB, (0,))
+
+    assert chunk.num_data_bytes == 10
+    assert len(chunk.shapes_encoder.array) == 1
+    for i, buffer in enumerate(buffers):
+        sb, eb = chunk.byte_positions_encoder[i]
+        assert bytes(chunk.memoryview_data[sb:eb]) == bytes(buffer)
+
+    with pytest.raises(FullChunkError):
+        chunk.append_samples_multiple(buffers, 19, (0,))
+    assert chunk.num_data_bytes == 10
+
+
+def test_shrink_to_fit():
+    chunk = Chunk()
+    for _ in range(3):
+        chunk.append_sample(memoryview(bytes(100)), 1 * MB, (100,))
+
+    # capacity is doubled, so it is counted by `nbytes` until it is dropped
+    assert chunk.nbytes > len(chunk.tobytes())
+    view = chunk.memoryview_data
+
+    chunk.shrink_to_fit()
+    assert chunk.nbytes == len(chunk.tobytes())
+    assert view.tobytes() == bytes(300)
+
+
+def test_get_bytes():
+    chunk = Chunk()
+    for i in range(10):
+        sample = np.arange(i, dtype="int32")
+        chunk.append_sample(memoryview(sample.tobytes()), 1 * MB, sample.shape)
+
+    serialized = bytes(chunk.tobytes())
+    header_num_bytes = len(serialized) - chunk.num_data_bytes
+    ranges = [
+        (None, None),
+        (0, 5),
+        (0, header_num_bytes + 7),
+        (header_num_bytes, None),
+        (header_num_bytes + 4, header_num_bytes + 12),
+        (3, None),
+    ]
+    for start, end in ranges:
+        assert bytes(chunk.get_bytes(start, end)) == serialized[start:end]
+
+    # cached chunks are read without being serialized
+    cache = LRUCache(MemoryProvider(), MemoryProvider(), 1 * MB)
+    cache["chunk"] = chunk
+    chunk.tobytes = None  # type: ignore
+    start, end = header_num_bytes + 4, header_num_bytes + 12
+    assert bytes(cache.get_bytes("chunk", start, end)) == serialized[start:end]
@@ -0,0 +1,20 @@
+import numpy as np
+from hub.core.chunk_packing import plan_chunk_assignments
+
+
+def test_plan_chunk_assignments():
+    sizes = np.array([10, 10, 10, 20, 5, 0], dtype=np.int64)
+
+    # first sample continues the last chunk
+    assignments = plan_chunk_assignments(sizes, 5, True, 16, 32)
+    np.testing.assert_array_equal(assignments, [0, 0, 1, 1, 2, 3])
+
+    # last chunk is already over the min size
+    assignments = plan_chunk_assignments(sizes, 20, True, 16, 32)
+    np.testing.assert_array_equal(assignments, [1, 1, 2, 2, 3, 4])
+
+    # no last chunk
+    assignments = plan_chunk_assignments(sizes, 0, False, 16, 32)
+    np.testing.assert_array_equal(assignments, [1, 1, 2, 2, 3, 4])
+
+    assert len(plan_chunk_assignments(sizes[:0], 0, False, 16, 32)) == 0
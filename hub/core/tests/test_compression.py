@@ -1,7 +1,14 @@
 from hub.tests.common import get_actual_compression_from_buffer
 import numpy as np
 import pytest
-from hub.core.compression import compress_array, decompress_array
+from hub.core.compression import (
+    compress_array,
+    compress_multiple,
+    decompress_array,
+    decompress_multiple,
+    downscale_array,
+    _TURBOJPEG,
+)
 
 
 parametrize_compressions = pytest.mark.parametrize(
@@ -21,5 +28,102 @@ def test_array(compression, shape):
     array = np.zeros(shape, dtype="uint8")  # TODO: handle non-uint8
     compressed_buffer = compress_array(array, compression)
     assert get_actual_compression_from_buffer(compressed_buffer) == compression
-    decompressed_array = decompress_array(compressed_buffer, shape=shape)
+
+    # chunks hand out memoryviews over their data, not bytes
+    decompressed_array = decompress_array(memoryview(compressed_buffer), shape=shape)
     np.testing.assert_array_equal(array, decompressed_array)
+
+
+@parametrize_compressions
+def test_multi_array(compression):
+    shapes = [(100, 100, 3), (28, 28, 3), (32, 32, 3)]
+    arrays = [np.ones(shape, dtype="uint8") * 255 for shape in shapes]
+    compressed_buffers = compress_multiple(arrays, compression)
+    decompressed_arrays = decompress_multiple(
+        list(map(memoryview, compressed_buffers)), shapes, compression
+    )
+
+    for array, decompressed_array in zip(arrays, decompressed_arrays):
+        np.testing.assert_array_equal(array, decompressed_array)
+
+
+@parametrize_compressions
+def test_multi_array_out(compression):
+    shape = (28, 28, 3)
+    arrays = [np.ones(shape, dtype="uint8") * i for i in (0, 127, 255)]
+    compressed_buffers = compress_multiple(arrays, compression)
+
+    out = np.empty((3, *shape), dtype="uint8")
+    decompressed = decompress_multiple(
+        compressed_buffers, [shape] * 3, compression, out=out
+    )
+
+    assert decompressed is out
+    np.testing.assert_array_equal(out, np.stack(arrays))
+
+
+@parametrize_compressions
+def test_decompressed_arrays_are_writable(compression):
+    shape = (28, 28, 3)
+    buffers = compress_multiple([np.zeros(shape, dtype="uint8")] * 2, compression)
+
+    assert decompress_array(buffers[0], shape, compression).flags.writeable
+    crop = (0, 0, 8, 8)
+    assert decompress_array(buffers[0], shape, compression, crop=crop).flags.writeable
+    for array in decompress_multiple(buffers, [shape] * 2, compression):
+        assert array.flags.writeable
+
+
+@parametrize_compressions
+@parametrize_image_shapes
+def test_crop(compression, shape):
+    array = np.random.randint(0, 255, size=shape, dtype="uint8")
+    compressed_buffer = compress_array(array, compression)
+    expected = decompress_array(compressed_buffer, shape, compression)
+
+    crop = (3, 5, 17, 20)  # left, upper, right, lower
+    cropped = decompress_array(compressed_buffer, shape, compression, crop=crop)
+    np.testing.assert_array_equal(cropped, expected[5:20, 3:17])
+
+
+@pytest.mark.skipif(_TURBOJPEG is None, reason="libjpeg-turbo is not installed")
+@parametrize_image_shapes
+def test_turbojpeg_crop(shape):
+    # smooth content, so the differences are only caused by decoding the crop on its own
+    ys, xs = np.mgrid[: shape[0], : shape[1]]
+    array = (
+        ((xs + ys) * 255 // (shape[0] + shape[1]))
+        .astype("uint8")
+        .reshape(shape[:2] + (1,) * (len(shape) - 2))
+    )
+    array = np.broadcast_to(array, shape).copy()
+    compressed_buffer = compress_array(array, "jpeg")
+    expected = decompress_array(compressed_buffer, shape, "jpeg")
+
+    crop = (3, 5, 17, 20)  # left, upper, right, lower
+    cropped = decompress_array(compressed_buffer, shape, "jpeg", crop=crop)
+    assert cropped.shape == expected[5:20, 3:17].shape
+
+    # lossless crops are decoded on their own, so the pixels near the new edges are only approximately equal
+    diff = np.abs(cropped.astype("int16") - expected[5:20, 3:17].astype("int16"))
+    assert diff.mean() < 2
+    assert diff.max() <= 16
+
+
+def test_jpeg_quality():
+    array = np.random.randint(0, 255, size=(100, 100, 3), dtype="uint8")
+    low = compress_array(array, "jpeg", quality=10)
+    high = compress_array(array, "jpeg", quality=95)
+    assert len(low) < len(high)
+
+    # png is lossless, quality is ignored
+    assert compress_array(array, "png", quality=10) == compress_array(array, "png")
+
+
+@parametrize_image_shapes
+def test_downscale(shape):
+    array = np.zeros(shape, dtype="uint8")
+    assert downscale_array(array, 100) is array
+
+    downscaled = downscale_array(array, 16)
+    assert downscaled.shape == (16, 16, *shape[2:])
@@ -0,0 +1,57 @@
+import numpy as np
+from hub.core.sample import Sample, compressed_bytes_multiple
+from hub.tests.common import get_actual_compression_from_buffer
+
+
+def test_compressed_bytes_cache():
+    sample = Sample(array=np.zeros((32, 32, 3), dtype="uint8"))
+
+    jpeg = sample.compressed_bytes("jpeg")
+    png = sample.compressed_bytes("png")
+
+    assert get_actual_compression_from_buffer(jpeg) == "jpeg"
+    assert get_actual_compression_from_buffer(png) == "png"
+
+    # cached bytes are reused, but only for the same compression
+    assert sample.compressed_bytes("jpeg") is jpeg
+    assert sample.compressed_bytes("png") is png
+    assert sample.compressed_bytes("jpeg", quality=95) is not jpeg
+
+
+def test_compressed_bytes_multiple():
+    samples = [Sample(array=np.ones((i, i, 3), dtype="uint8")) for i in range(1, 5)]
+    cached = samples[0].compressed_bytes("png")
+
+    buffers = compressed_bytes_multiple(samples, "png")
+
+    assert buffers[0] is cached
+    for sample, buffer in zip(samples, buffers):
+        assert get_actual_compression_from_buffer(buffer) == "png"
+        assert sample.compressed_bytes("png") is buffer
+
+
+def test_uncompressed_bytes():
+    array = np.arange(12, dtype="int32").reshape(3, 4)
+    buffer = Sample(array=array).uncompressed_bytes()
+
+    # contiguous arrays are not copied
+    assert np.shares_memory(np.frombuffer(buffer, dtype="uint8"), array)
+    assert bytes(buffer) == array.tobytes()
+
+    transposed = array.T
+    assert bytes(Sample(array=transposed).uncompressed_bytes()) == transposed.tobytes()
+
+    empty = np.zeros((0, 4), dtype="float32")
+    assert len(Sample(array=empty).uncompressed_bytes()) == 0
+
+
+def test_append_without_decoding(memory_ds, cat_path):
+    memory_ds.create_tensor("images", htype="image", sample_compression="jpeg")
+
+    sample = Sample(cat_path)
+    memory_ds.images.append(sample)
+
+    # already compressed with the tensor's compression, so the file's bytes are stored as they are
+    assert sample.is_lazy
+    assert memory_ds.images.shape == (1, 900, 900, 3)
+    np.testing.assert_array_equal(memory_ds.images[0].numpy(), Sample(cat_path).array)
@@ -41,6 +41,8 @@ HTYPE_CONFIGURATIONS: Dict[str, Dict] = {
     "image": {
         "dtype": "uint8",
         "sample_compression": REQUIRE_USER_SPECIFICATION,
+        "compression_quality": None,  # jpeg quality (1-100), None uses the encoder's default
+        "max_side": None,  # images are downscaled so their height and width don't exceed this
     },
     "class_label": {
         "dtype": "uint32",
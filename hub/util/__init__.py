@@ -8,6 +8,7 @@ __pdoc__ = {
     "from_tfds": False,
     "get_property": False,
     "get_storage_provider": False,
+    "jit": False,
     "join_chunks": False,
     "keys": False,
     "path": False,
@@ -68,11 +68,12 @@ def combine_chunk_id_encoders(
     encoded_ids = worker_chunk_id_encoder._encoded
     if encoded_ids.size != 0:
         offset = ds_chunk_id_encoder.num_samples
-        for encoded_id in encoded_ids:
-            encoded_id[1] += offset
-            if ds_chunk_id_encoder._encoded.size == 0:
-                ds_chunk_id_encoder._encoded = np.reshape(encoded_id, (-1, 2))
-            else:
-                ds_chunk_id_encoder._encoded = np.vstack(
-                    [ds_chunk_id_encoder._encoded, encoded_id]
-                )
+        # `_encoded` is read-only, so the offset is applied to a copy
+        encoded_ids = encoded_ids.copy()
+        encoded_ids[:, 1] += offset
+        if ds_chunk_id_encoder._encoded.size == 0:
+            ds_chunk_id_encoder._encoded = encoded_ids
+        else:
+            ds_chunk_id_encoder._encoded = np.vstack(
+                [ds_chunk_id_encoder._encoded, encoded_ids]
+            )
@@ -478,6 +478,13 @@ class ChunkIdEncoderError(ChunkEngineError):
     pass
 
 
+class EncodingOverflowError(ChunkEngineError):
+    def __init__(self, value: int, max_value: int):
+        super().__init__(
+            f"Value {value} is too large to be encoded, encoded values must be <= {max_value}."
+        )
+
+
 class ChunkSizeTooSmallError(ChunkEngineError):
     def __init__(
         self,
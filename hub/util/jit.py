@@ -0,0 +1,16 @@
+try:
+    from numba import njit  # type: ignore
+
+    numba_installed = True
+except ImportError:
+    numba_installed = False
+
+
+if not numba_installed:
+
+    def njit(*args, **kwargs):  # type: ignore
+        """Fallback for `numba.njit` when numba is not installed. The decorated function is returned as is, so it runs as regular python."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -9,16 +9,18 @@ def test_read(cat_path, flower_path):
     assert flower.is_lazy
 
     assert cat.shape == (900, 900, 3)
-    assert not cat.is_lazy, "If any properties are read, this Sample is not lazy"
     assert cat.compression == "jpeg"
     assert cat.dtype == "uint8"
+    assert cat.is_lazy, "Shape, compression and dtype are read from the header only"
     assert cat.array.shape == (900, 900, 3)
+    assert not cat.is_lazy, "If the array is read, this Sample is not lazy"
 
     assert flower.shape == (513, 464, 4)
-    assert not flower.is_lazy, "If any properties are read, this Sample is not lazy"
     assert flower.compression == "png"
     assert flower.dtype == "uint8"
+    assert flower.is_lazy, "Shape, compression and dtype are read from the header only"
     assert flower.array.shape == (513, 464, 4)
+    assert not flower.is_lazy, "If the array is read, this Sample is not lazy"
 
 
 # TODO: test creating Sample with np.ndarray